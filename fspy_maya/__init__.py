@@ -1,12 +1,30 @@
-
 VERSION = (0, 9, 3)
 __version__ = '.'.join(map(str, VERSION))
 
 
-try:
-    #build distribution will fail, since maya modules aren't present.
-    #IF the toml gets the versioning info from the module.
-    from .core import *
-except ModuleNotFoundError:
-    pass
+import importlib
+import importlib.util
+
 
+def __getattr__(name):
+    """Imports core, and the pymel it needs, the first time its API is used
+    
+    The Maya-free modules, e.g. fspy_maya.fspy in a pool worker, can then be
+    imported without starting a Maya session.
+    """
+    if name.startswith('_'):
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    
+    #"from fspy_maya import fspy" looks for the attribute before importing the submodule
+    if importlib.util.find_spec('{0}.{1}'.format(__name__, name)) is not None:
+        return importlib.import_module('{0}.{1}'.format(__name__, name))
+    
+    try:
+        #build distribution will fail, since maya modules aren't present.
+        #IF the toml gets the versioning info from the module.
+        from . import core
+    except ModuleNotFoundError:
+        core = None
+    if core is None or not hasattr(core, name):
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    return getattr(core, name)
@@ -0,0 +1,134 @@
+"""fSpy to Maya unit, up-axis and camera conversions that don't need Maya"""
+import math
+import collections
+
+
+#centimeters per fSpy reference distance unit
+UNIT_SCALES = {
+    'Millimeters': 0.1,
+    'Meters': 100.0,
+    'Kilometers': 100000.0,
+    'Inches': 2.54,
+    'Feet': 30.48,
+    'Miles': 160900.0,
+}
+
+#every referenceDistanceUnit fSpy writes, the ones missing from UNIT_SCALES are 1 to 1
+REFERENCE_DISTANCE_UNITS = ['None', 'Centimeters'] + list(UNIT_SCALES)
+
+#how an up-axis maps into Y-up space, as fSpy rows (they multiply column vectors)
+_TO_Y_UP = {
+    'y': ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)),
+    #(x, y, z) -> (x, z, -y)
+    'z': ((1, 0, 0, 0), (0, 0, 1, 0), (0, -1, 0, 0), (0, 0, 0, 1)),
+}
+
+#the default 35mm full aperture, in inches
+DEFAULT_HORIZONTAL_APERTURE = 1.41732
+
+#a camera's transform and lens as set_camera() sets them. Rotations and fields
+#of view are in radians, apertures and film offsets in inches and the focal length in millimeters.
+CameraValues = collections.namedtuple('CameraValues', ['translate', 'rotate', 'focal_length',
+                                                       'horizontal_fov', 'vertical_fov',
+                                                       'horizontal_aperture', 'vertical_aperture',
+                                                       'horizontal_offset', 'vertical_offset'])
+
+
+def get_scale_length(project):
+    """Returns the centimeters per unit of the project's reference distance"""
+    return UNIT_SCALES.get(project.reference_distance_unit, 1)
+
+
+def multiply_matrices(a, b):
+    return tuple(tuple(sum(a[row][idx] * b[idx][col] for idx in range(4)) for col in range(4))
+                 for row in range(4))
+
+
+def transpose_matrix(a):
+    return tuple(zip(*a))
+
+
+def _build_conversion_matrices():
+    #maya_from_y_up is the inverse of _TO_Y_UP, they're rotations so that's the transpose
+    matrices = {}
+    for guide_up, to_y_up in _TO_Y_UP.items():
+        for maya_up, maya_to_y_up in _TO_Y_UP.items():
+            axes = multiply_matrices(transpose_matrix(maya_to_y_up), to_y_up)
+            for unit in REFERENCE_DISTANCE_UNITS:
+                scale = UNIT_SCALES.get(unit, 1)
+                matrices[(unit, guide_up, maya_up)] = tuple(tuple(value * scale for value in row)
+                                                            for row in axes)
+    return matrices
+
+
+#(referenceDistanceUnit, fSpy up-axis, Maya up-axis) -> fSpy world to Maya world matrix
+CONVERSION_MATRICES = _build_conversion_matrices()
+
+
+def get_conversion_matrix(unit, z_up=False, maya_up_axis='y'):
+    """Returns the matrix that takes fSpy world space to Maya world space
+    
+    It's in fSpy's row layout, so it's left multiplied with an fSpy camera
+    transform or a column vector point. Unknown units are treated as centimeters.
+    """
+    guide_up = 'z' if z_up else 'y'
+    if unit not in UNIT_SCALES:
+        unit = 'Centimeters'
+    return CONVERSION_MATRICES[(unit, guide_up, maya_up_axis)]
+
+
+def get_project_conversion_matrix(project, maya_up_axis='y'):
+    return get_conversion_matrix(project.reference_distance_unit, project.z_up, maya_up_axis)
+
+
+def get_camera_matrix(project, maya_up_axis='y'):
+    """Returns the project's camera transform in Maya world space, in fSpy's row layout"""
+    return multiply_matrices(get_project_conversion_matrix(project, maya_up_axis),
+                             project.camera_parameters.camera_transform)
+
+
+def to_maya_point(project, point, maya_up_axis='y'):
+    """Converts an fSpy world space point to a Maya world space point"""
+    matrix = get_project_conversion_matrix(project, maya_up_axis)
+    return tuple(sum(row[idx] * point[idx] for idx in range(3)) for row in matrix[:3])
+
+
+def get_maya_matrix(project, maya_up_axis='y'):
+    """Returns the camera's world matrix in Maya's layout, translation in the last row
+    
+    The unit scale only goes on the translation, so the rotation rows stay unit length.
+    """
+    rows = get_camera_matrix(project, maya_up_axis)
+    scale = rows[3][3]
+    matrix = [[rows[col][row] / scale for col in range(3)] + [0.0] for row in range(3)]
+    matrix.append([rows[0][3], rows[1][3], rows[2][3], 1.0])
+    return matrix
+
+
+def get_euler_rotation(matrix):
+    """Returns the xyz rotate order angles, in radians, of a Maya layout matrix"""
+    sin_y = max(-1.0, min(1.0, -matrix[0][2]))
+    rotate_y = math.asin(sin_y)
+    if abs(sin_y) < 1.0 - 1e-9:
+        rotate_x = math.atan2(matrix[1][2], matrix[2][2])
+        rotate_z = math.atan2(matrix[0][1], matrix[0][0])
+    else:
+        #gimbal lock, put all of the remaining rotation on z
+        rotate_x = 0.0
+        rotate_z = math.atan2(-matrix[1][0], matrix[1][1])
+    return (rotate_x, rotate_y, rotate_z)
+
+
+def get_camera_values(project, horizontal_aperture=DEFAULT_HORIZONTAL_APERTURE, maya_up_axis='y'):
+    """Returns the CameraValues set_camera() would give a camera with this horizontal aperture"""
+    params = project.camera_parameters
+    matrix = get_maya_matrix(project, maya_up_axis)
+    
+    focal_length = horizontal_aperture * 25.4 / (2.0 * math.tan(params.fov_horiz / 2.0))
+    vertical_aperture = horizontal_aperture / (params.image_width / params.image_height)
+    x_offset = -(horizontal_aperture * params.principal_point[0]) / 2.0
+    y_offset = -(horizontal_aperture * params.principal_point[1]) / 2.0
+    
+    return CameraValues(tuple(matrix[3][:3]), get_euler_rotation(matrix), focal_length,
+                        params.fov_horiz, params.fov_vertical, horizontal_aperture,
+                        vertical_aperture, x_offset, y_offset)
@@ -1,52 +1,204 @@
 import math
 import os
-import imghdr
 import copy
+import contextlib
 
 from struct import *
 
 import pymel.core as pm
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 
 from fspy_maya import fspy
+from fspy_maya import conversion
+from fspy_maya import scene_index
+from fspy_maya import plate_loader
+from fspy_maya.conversion import UNIT_SCALES
+from fspy_maya.plate_cache import SharedPlateCache
 
+try:
+    from fspy_maya import track
+except ImportError:
+    #tracks need numpy, which not every mayapy has
+    track = None
 
 
-def set_camera(project, camera : pm.nodetypes.Transform):
-    scale_length = 1
-    unit = project.reference_distance_unit
-    if unit == 'Millimeters':
-        scale_length = 0.1
-    elif unit == 'Meters':
-        scale_length = 100.0
-    elif unit == 'Kilometers':
-        scale_length = 100000.0
-    elif unit == 'Inches':
-        scale_length = 2.54 
-    elif unit == 'Feet':
-        scale_length = 30.48
-    elif unit == 'Miles':
-        scale_length = 160900.0
+GUIDE_GRID_DIVISIONS = 10
+
+#fSpy's guide plane names and the two axes each plane spans
+GUIDE_GRID_PLANES = {
+    'xyGridPlane': (0, 1),
+    'yzGridPlane': (1, 2),
+    'zxGridPlane': (2, 0),
+}
+
+#overrideColor index for the first, second and third vanishing point lines
+VANISHING_LINE_COLORS = (13, 14, 6)
+
+
+UNDO_CHUNK_NAME = 'fSpy Import'
+
+#the command fspy_plugin registers to put nodes made through the API on the undo queue
+API_UNDO_COMMAND = 'fspyApiUndo'
+#ApiOperations waiting for API_UNDO_COMMAND to run them
+_PENDING_OPERATIONS = []
+
+#how far apply_track() lets a reduced curve stray from the solve, in centimeters,
+#radians, millimeters and inches. Keys closer than this to the line through their neighbours go.
+KEY_TOLERANCES = {
+    'translate': 0.01,
+    'rotate': math.radians(0.01),
+    'focalLength': 0.01,
+    'verticalFilmAperture': 0.0001,
+    'horizontalFilmOffset': 0.0001,
+    'verticalFilmOffset': 0.0001,
+}
+
+#the DG node fspy_plugin registers, it computes a camera from an .fspy file path
+CAMERA_NODE_TYPE = 'fspyCamera'
+
+
+@contextlib.contextmanager
+def import_transaction(undoable=True, chunk_name=UNDO_CHUNK_NAME):
+    """Groups everything done in the block into one undo step and rolls back on errors
+    
+    Example:
+        with import_transaction():
+            set_camera(project, camera)
+    
+    Parameters:
+    -----------
+    undoable : bool
+        When False nothing is recorded to the undo queue, which saves time
+        and memory in headless batch imports. A failure then only deletes
+        the nodes created in the block, it can't restore edited attributes.
+    """
+    created_nodes = []
+    def on_node_added(node, *args):
+        created_nodes.append(om.MObjectHandle(node))
         
+    callback_id = om.MDGMessage.addNodeAddedCallback(on_node_added, 'dependNode')
+    undo_state = pm.undoInfo(query=True, stateWithoutFlush=True)
+    if undoable:
+        pm.undoInfo(openChunk=True, chunkName=chunk_name)
+    else:
+        pm.undoInfo(stateWithoutFlush=False)
         
-    params = project.camera_parameters
-    transform_rows = params.camera_transform
+    try:
+        yield
+    except:
+        if undoable:
+            pm.undoInfo(closeChunk=True)
+            #an empty chunk isn't queued, undoing then would take back the user's last action
+            if undo_state and pm.undoInfo(query=True, undoName=True) == chunk_name:
+                pm.undo()
+                
+        #whatever undo didn't remove, e.g. API nodes made without the plug-in's command, goes too
+        pm.undoInfo(stateWithoutFlush=False)
+        try:
+            leftovers = [om.MFnDependencyNode(handle.object()).absoluteName()
+                         for handle in created_nodes if handle.isValid()]
+            leftovers = [node for node in leftovers if pm.objExists(node)]
+            if leftovers:
+                pm.delete(leftovers)
+        finally:
+            pm.undoInfo(stateWithoutFlush=undo_state)
+        raise
+    else:
+        if undoable:
+            pm.undoInfo(closeChunk=True)
+        else:
+            pm.undoInfo(stateWithoutFlush=undo_state)
+    finally:
+        om.MMessage.removeCallback(callback_id)
+
+
+class ApiOperation:
+    """Makes nodes straight through the API in a way undo can take back
+    
+    API calls aren't recorded in the undo queue, so run() hands the
+    operation to API_UNDO_COMMAND, which fspy_plugin registers. Undoing
+    that command deletes the nodes and redoing it calls create() again.
+    
+    Parameters:
+    -----------
+    create : callable
+        Makes the nodes and returns the MObjects of the top ones, deleting
+        those has to delete everything it made
+    """
+    def __init__(self, create):
+        self._create = create
+        self._handles = []
+        
+    def doIt(self):
+        self._handles = [om.MObjectHandle(node) for node in self._create()]
+        
+    def undoIt(self):
+        modifier = om.MDagModifier()
+        for handle in self._handles:
+            if handle.isValid():
+                modifier.deleteNode(handle.object())
+        modifier.doIt()
+        
+    def run(self):
+        """Does the operation and returns the full paths of the top nodes"""
+        if hasattr(cmds, API_UNDO_COMMAND):
+            _PENDING_OPERATIONS.append(self)
+            getattr(cmds, API_UNDO_COMMAND)()
+        else:
+            #no plug-in, the nodes can't be undone but import_transaction() still removes them on errors
+            self.doIt()
+        return [om.MFnDagNode(handle.object()).fullPathName() for handle in self._handles]
+    
+    
+def pop_pending_operation():
+    """Returns the ApiOperation API_UNDO_COMMAND was called to run"""
+    return _PENDING_OPERATIONS.pop()
+
+
+def get_maya_up_axis():
+    return pm.upAxis(query=True, axis=True).lower()
+
+
+def get_conversion_matrix(unit, z_up=False, maya_up_axis=None):
+    """conversion.get_conversion_matrix(), defaulting to the scene's up-axis"""
+    return conversion.get_conversion_matrix(unit, z_up, maya_up_axis or get_maya_up_axis())
+
+
+def get_camera_matrix(project, maya_up_axis=None):
+    """conversion.get_camera_matrix(), defaulting to the scene's up-axis"""
+    return conversion.get_camera_matrix(project, maya_up_axis or get_maya_up_axis())
+
+
+def to_maya_point(project, point, maya_up_axis=None):
+    """conversion.to_maya_point(), defaulting to the scene's up-axis"""
+    return conversion.to_maya_point(project, point, maya_up_axis or get_maya_up_axis())
+
+
+def set_camera(project, camera : pm.nodetypes.Transform, plate_cache=None, defer_plate=False):
+    """Sets the camera and its image plane from the project
     
-    for row in transform_rows:
-        for idx in range(0, len(row)):
-            row[idx] = row[idx] * scale_length
+    The plate goes to plate_cache, a plate_cache.SharedPlateCache, when
+    given or set by FSPY_PLATE_CACHE, otherwise into the workspace sourceimages.
+    
+    Parameters:
+    -----------
+    defer_plate : bool
+        Leaves the image plane empty until a panel looks through the camera
+        or plate_loader.extract_plate() is called. The project has to come
+        from a file, and can be loaded with load_image=False.
+    """
+    if defer_plate and not project.source_path:
+        if project.image_data is None:
+            raise ValueError("Deferred plates need a project read from a file")
+        defer_plate = False
 
-    #TODO: Add logic that considers Maya's up-axis
-    if project.z_up:
-        y, z = copy.copy(transform_rows[1]), copy.copy(transform_rows[2])
+    if plate_cache is None:
+        plate_cache = SharedPlateCache.from_environment()
 
-        #Y gets Z rotation axis
-        transform_rows[1] = z
-     
-        #z -y
-        transform_rows[2][0] = -y[0]
-        transform_rows[2][1] = -y[1]
-        transform_rows[2][2] = -y[2]
-        transform_rows[2][3] = -y[3]
+    params = project.camera_parameters
+    transform_rows = get_camera_matrix(project)
 
 
     # Creating a camera, 4x4 matrix and decompose-matrix, then setting up the connections.
@@ -96,28 +248,380 @@ def set_camera(project, camera : pm.nodetypes.Transform):
     image_plane_shape.offset.set([x_offset, y_offset])
     image_path = image_plane_shape.imageName.get()
     
+    if not image_path and not defer_plate:
+        image_path = plate_loader.save_plate(project.image_data, plate_loader.get_plate_folder(),
+                                             plate_cache=plate_cache)
+        image_plane_shape.imageName.set(image_path, type='string')
+        
+    scene_index.tag_camera(camera, project)
+    if defer_plate and not image_path:
+        plate_loader.watch_panels()
+
+
+def connect_camera_node(camera : pm.nodetypes.Transform, file_path):
+    """Drives the camera with an fspyCamera node reading file_path
+    
+    The node re-reads the project lazily, so pointing the camera at a new
+    solve is just a change of the node's filePath. The image plane's offset
+    follows the node too, and the node calls refresh_plate() when the file
+    changes. Needs fspy_plugin loaded.
+    
+    Returns:
+    --------
+    pm.PyNode
+        The fspyCamera node
+    """
+    camera_shape: pm.nodetypes.Camera = camera.getShape()
+    camera_node = pm.createNode(CAMERA_NODE_TYPE, name='{0}_fspyCamera'.format(camera.nodeName()))
+    camera_node.filePath.set(file_path, type='string')
+    camera_node.horizontalFilmAperture.set(camera_shape.getHorizontalFilmAperture())
+    camera_node.upAxis.set(1 if get_maya_up_axis() == 'z' else 0)
+    
+    pm.connectAttr(camera_node.outTranslate, camera.translate, force=True)
+    pm.connectAttr(camera_node.outRotate, camera.rotate, force=True)
+    pm.connectAttr(camera_node.outFocalLength, camera_shape.focalLength, force=True)
+    pm.connectAttr(camera_node.outVerticalFilmAperture, camera_shape.verticalFilmAperture, force=True)
+    pm.connectAttr(camera_node.outHorizontalFilmOffset, camera_shape.horizontalFilmOffset, force=True)
+    pm.connectAttr(camera_node.outVerticalFilmOffset, camera_shape.verticalFilmOffset, force=True)
+    for image_plane in pm.general.listConnections(camera_shape, type="imagePlane"):
+        image_plane_shape = image_plane.getShape()
+        pm.connectAttr(camera_node.outHorizontalFilmOffset, image_plane_shape.offsetX, force=True)
+        pm.connectAttr(camera_node.outVerticalFilmOffset, image_plane_shape.offsetY, force=True)
+    return camera_node
+
+
+def refresh_plate(camera_node, plate_cache=None):
+    """Replaces the plates of the cameras an fspyCamera node drives with its file's plate
+    
+    The cameras are tagged with the new source, and the plates are
+    extracted in the background like deferred ones.
+    """
+    camera_node = pm.PyNode(camera_node)
+    file_path = camera_node.filePath.get()
+    if not file_path or not os.path.isfile(file_path):
+        #the node reports the missing file
+        return
+    
+    project = fspy.Project(file_path, load_image=False)
+    for camera_shape in set(pm.listConnections(camera_node.outFocalLength, type='camera', shapes=True)):
+        camera = camera_shape.getParent()
+        for image_plane in pm.general.listConnections(camera_shape, type="imagePlane"):
+            image_plane.getShape().imageName.set('', type='string')
+        scene_index.tag_camera(camera, project)
+        plate_loader.extract_plate(camera, plate_cache=plate_cache)
+
+
+def _key_plug(plug, times, values):
+    #reuse the plug's anim curve, replacing its keys, or make a new one
+    anim_fn = oma.MFnAnimCurve()
+    source = plug.source()
+    if not source.isNull and source.node().hasFn(om.MFn.kAnimCurve):
+        anim_fn.setObject(source.node())
+    else:
+        if not source.isNull:
+            pm.disconnectAttr(source.name(), plug.name())
+        anim_fn.create(plug)
+    #linear tangents, so the curve between kept keys is the line reduce_keys() checked
+    anim_fn.addKeys(times, om.MDoubleArray(values.tolist()),
+                    oma.MFnAnimCurve.kTangentLinear, oma.MFnAnimCurve.kTangentLinear,
+                    keepExistingKeys=False)
+
+
+def apply_track(camera_track, camera : pm.nodetypes.Transform, maya_up_axis=None,
+                reduce_keys=True, tolerances=None):
+    """Keys the camera with every frame of a track.Track
+    
+    Each attribute's curve is written with one array call rather than a
+    setKeyframe per frame.
+    
+    Parameters:
+    -----------
+    reduce_keys : bool
+        Drops the keys of still or steadily moving stretches, see track.reduce_keys()
+    tolerances : dict
+        Overrides KEY_TOLERANCES, e.g. {'translate': 0.1}
+        
+    Returns:
+    --------
+    dict
+        The number of keys dropped from each attribute
+    """
+    if track is None:
+        raise ImportError("fSpy tracks need numpy")
+    
+    camera_shape: pm.nodetypes.Camera = camera.getShape()
+    values = track.get_camera_values(camera_track, camera_shape.getHorizontalFilmAperture(),
+                                     maya_up_axis or get_maya_up_axis())
+    key_tolerances = dict(KEY_TOLERANCES, **(tolerances or {}))
+    time_unit = om.MTime.uiUnit()
+    
+    #(node, attribute, a value per frame, KEY_TOLERANCES name)
+    curves = [(camera, 'translate' + axis, values.translate[:, idx], 'translate') for idx, axis in enumerate('XYZ')]
+    curves += [(camera, 'rotate' + axis, values.rotate[:, idx], 'rotate') for idx, axis in enumerate('XYZ')]
+    curves += [(camera_shape, attr, attr_values, attr) for attr, attr_values in
+               [('focalLength', values.focal_length),
+                ('verticalFilmAperture', values.vertical_aperture),
+                ('horizontalFilmOffset', values.horizontal_offset),
+                ('verticalFilmOffset', values.vertical_offset)]]
+    
+    selection = om.MSelectionList()
+    removed = {}
+    for idx, (node, attr, attr_values, tolerance_name) in enumerate(curves):
+        frames = camera_track.frames
+        if reduce_keys:
+            reduced = track.reduce_keys(frames, attr_values, key_tolerances[tolerance_name])
+            frames, attr_values, removed[attr] = reduced.times, reduced.values, reduced.removed
+        times = om.MTimeArray([om.MTime(float(frame), time_unit) for frame in frames])
+        selection.add(node.attr(attr).name())
+        _key_plug(selection.getPlug(idx), times, attr_values)
+        
+    return removed
+
+
+def _image_to_camera_point(params, point, depth):
+    """Converts a relative image point to a point in the camera's local space
+    
+    The result lies on the ray through the image point, "depth" units in
+    front of the camera.
+    """
+    aspect_ratio = params.image_width / params.image_height
+    image_x = point[0] * 2.0 - 1.0
+    image_y = 1.0 - point[1] * 2.0
+    if aspect_ratio >= 1.0:
+        image_y /= aspect_ratio
+        half_size = math.tan(params.fov_horiz / 2.0)
+    else:
+        image_x *= aspect_ratio
+        half_size = math.tan(params.fov_vertical / 2.0)
+        
+    return om.MPoint((image_x - params.principal_point[0]) * half_size * depth,
+                     (image_y - params.principal_point[1]) * half_size * depth,
+                     -depth)
+
+
+def _create_curves(name, point_pairs, parent=None, colors=None):
+    """Builds one transform holding a linear curve shape for each point pair
+    
+    The shapes are created straight through the API, so no creation
+    commands or construction history nodes are added to the DG.
+    """
+    parent_name = parent.longName() if parent is not None else None
+    def create():
+        dag_modifier = om.MDagModifier()
+        parent_object = om.MObject.kNullObj
+        if parent_name is not None:
+            parent_object = om.MSelectionList().add(parent_name).getDependNode(0)
+        
+        transform = dag_modifier.createNode('transform', parent_object)
+        dag_modifier.renameNode(transform, name)
+        dag_modifier.doIt()
+        
+        curve_fn = om.MFnNurbsCurve()
+        knots = om.MDoubleArray([0.0, 1.0])
+        for idx, (start, end) in enumerate(point_pairs):
+            shape = curve_fn.create(om.MPointArray([start, end]), knots, 1,
+                                    om.MFnNurbsCurve.kOpen, False, False, transform)
+            if colors:
+                shape_fn = om.MFnDependencyNode(shape)
+                shape_fn.findPlug('overrideEnabled', False).setBool(True)
+                shape_fn.findPlug('overrideColor', False).setInt(colors[idx])
+        return [transform]
+    
+    transform_path, = ApiOperation(create).run()
+    return pm.PyNode(transform_path)
+
+
+def _create_mesh(name, points, polygon_counts, polygon_connects):
+    """Builds a mesh from flat point and polygon arrays with a single create call"""
+    def create():
+        transform = om.MFnMesh().create(om.MPointArray(points), polygon_counts, polygon_connects)
+        om.MFnDependencyNode(transform).setName(name)
+        shape_path = om.MDagPath.getAPathTo(transform)
+        shape_path.extendToShape()
+        shading_group = om.MSelectionList().add('initialShadingGroup').getDependNode(0)
+        om.MFnSet(shading_group).addMember(shape_path)
+        return [transform]
+    
+    transform_path, = ApiOperation(create).run()
+    return pm.PyNode(transform_path)
+
+
+def create_guide(project):
+    """Creates the project's 3D guide (grid, box or axes) in Maya world space
+    
+    Returns:
+    --------
+    pm.nodetypes.Transform
+        The guide or None if the project has no guide
+    """
+    guide = project.overlay_3d_guide
+    size = project.reference_distance or 1.0
+    to_point = lambda point: om.MPoint(to_maya_point(project, point))
+
+    if guide in GUIDE_GRID_PLANES:
+        u_axis, v_axis = GUIDE_GRID_PLANES[guide]
+        divisions = GUIDE_GRID_DIVISIONS
+        half_size = size * divisions / 2.0
+        points = []
+        for v in range(divisions + 1):
+            for u in range(divisions + 1):
+                point = [0.0, 0.0, 0.0]
+                point[u_axis] = u * size - half_size
+                point[v_axis] = v * size - half_size
+                points.append(to_point(point))
+        
+        connects = []
+        row = divisions + 1
+        for v in range(divisions):
+            for u in range(divisions):
+                corner = v * row + u
+                connects.extend([corner, corner + 1, corner + row + 1, corner + row])
+                
+        return _create_mesh('fspy_guide_grid', points, [4] * (divisions * divisions), connects)
+
+    elif guide == 'box':
+        points = [to_point((x * size, y * size, z * size))
+                  for z in (0, 1) for y in (0, 1) for x in (0, 1)]
+        connects = [0, 2, 3, 1,  4, 5, 7, 6,  0, 1, 5, 4,
+                    2, 6, 7, 3,  0, 4, 6, 2,  1, 3, 7, 5]
+        return _create_mesh('fspy_guide_box', points, [4] * 6, connects)
+    
+    elif guide == 'xyzAxes':
+        origin = to_point((0, 0, 0))
+        axes = [(origin, to_point((size, 0, 0))),
+                (origin, to_point((0, size, 0))),
+                (origin, to_point((0, 0, size)))]
+        return _create_curves('fspy_guide_axes', axes, colors=VANISHING_LINE_COLORS)
+    
+    return None
+
+
+def create_vanishing_lines(project, camera : pm.nodetypes.Transform, depth=10.0):
+    """Creates curves for the project's vanishing lines parented to the camera
+    
+    The lines sit "depth" units in front of the camera so they overlay the
+    control points on the image plane when looking through the camera.
+    
+    Returns:
+    --------
+    pm.nodetypes.Transform
+        The curves' transform or None if the project has no vanishing lines
+    """
+    params = project.camera_parameters
+    point_pairs = []
+    colors = []
+    for idx, segments in enumerate(project.control_points.vanishing_lines):
+        for start, end in segments:
+            point_pairs.append((_image_to_camera_point(params, start, depth),
+                                _image_to_camera_point(params, end, depth)))
+            colors.append(VANISHING_LINE_COLORS[idx % len(VANISHING_LINE_COLORS)])
+            
+    if not point_pairs:
+        return None
+    
+    return _create_curves('fspy_vanishing_lines', point_pairs, parent=camera, colors=colors)
+    
+
+def get_camera_state(camera : pm.nodetypes.Transform, image_width, image_height,
+                     unit='Centimeters', z_up=False, base_state=None, maya_up_axis=None):
+    """Builds an fSpy project state from a Maya camera
+    
+    This is the inverse of set_camera(), so importing the result gives back
+    the same camera.
+    
+    Parameters:
+    -----------
+    base_state : dict
+        An optional state (e.g. Project.state) to update. Values this function
+        doesn't write, like control points, are kept, and so is its 3D guide
+        as long as it gives the same up-axis as z_up.
+    """
+    camera_shape: pm.nodetypes.Camera = camera.getShape()
+    scale_length = UNIT_SCALES.get(unit, 1)
+    
+    #Maya matrices have the translation in the last row, fSpy in the last column
+    world_matrix = camera.getMatrix(worldSpace=True)
+    maya_rows = [[world_matrix[col][row] for col in range(4)] for row in range(4)]
+    
+    #undo set_camera()'s up-axis change, the axes matrix is a rotation so its inverse is the transpose
+    axes = get_conversion_matrix('Centimeters', z_up, maya_up_axis)
+    transform_rows = [list(row) for row in conversion.multiply_matrices(conversion.transpose_matrix(axes), maya_rows)]
+    for row in transform_rows[:3]:
+        row[3] = row[3] / scale_length
+        
+    horizontal_aperture = camera_shape.getHorizontalFilmAperture()
+    fov_horiz = math.radians(camera_shape.getHorizontalFieldOfView())
+    camera_parameters = {
+        'principalPoint': {
+            'x': -2.0 * camera_shape.getHorizontalFilmOffset() / horizontal_aperture,
+            'y': -2.0 * camera_shape.getVerticalFilmOffset() / horizontal_aperture,
+        },
+        'horizontalFieldOfView': fov_horiz,
+        'verticalFieldOfView': math.radians(camera_shape.getVerticalFieldOfView()),
+        'relativeFocalLength': 1.0 / math.tan(fov_horiz / 2.0),
+        'cameraTransform': {'rows': transform_rows},
+        'imageWidth': image_width,
+        'imageHeight': image_height,
+    }
+    
+    state = copy.deepcopy(base_state) if base_state else {}
+    state['cameraParameters'] = camera_parameters
+    state.setdefault('calibrationSettingsBase', {})['referenceDistanceUnit'] = unit
+    #Project reads the up-axis from the guide name, so the user's guide is only replaced when it disagrees
+    global_settings = state.setdefault('globalSettings', {})
+    guide = global_settings.get('overlay3DGuide')
+    if not isinstance(guide, str) or (guide.lower().find('y') >= 0) != z_up:
+        global_settings['overlay3DGuide'] = 'xyGridPlane' if z_up else 'none'
+    
+    return state
+
+
+def export_camera(camera : pm.nodetypes.Transform, project_path, image_path=None, **kwargs):
+    """Writes a Maya camera and its image plane's image to an .fspy file
+    
+    Parameters:
+    -----------
+    image_path : str
+        The image to embed. Defaults to the camera's image plane image.
+    kwargs
+        Passed along to get_camera_state()
+    """
+    camera_shape: pm.nodetypes.Camera = camera.getShape()
+    image_plane = pm.general.listConnections(camera_shape, type="imagePlane")
+    if image_plane:
+        image_plane_shape = image_plane[0].getShape()
+        if not image_path:
+            image_path = image_plane_shape.imageName.get()
+        image_width, image_height = image_plane_shape.coverage.get()
+    else:
+        render_resolution = pm.PyNode('defaultResolution')
+        image_width, image_height = render_resolution.width.get(), render_resolution.height.get()
+        
     if not image_path:
-        tmp_dir =  pm.system.workspace.getPath()
-        tmp_filename = "fspy-temp-image"
-        image_path = os.path.join(tmp_dir, 'sourceimages', tmp_filename)
-        
-        #TODO: Find a better way to see the extension. Maybe project.image_data[1:4]?
-        tmp_file = open(image_path, 'wb')
-        tmp_file.write(project.image_data)
-        tmp_file.close()
-        ext = imghdr.what(image_path)
-        
-        if ext:
-            os.remove(image_path)
-            image_path = os.path.join(tmp_dir, 'sourceimages', '{0}.{1}'.format(tmp_filename, ext))
-            tmp_file = open(image_path, 'wb')
-            tmp_file.write(project.image_data)
-            tmp_file.close()            
+        raise ValueError('{0} has no image to export'.format(camera))
+    
+    state = get_camera_state(camera, image_width, image_height, **kwargs)
+    fspy.write_project(project_path, state, image_path)
+    
+    
+def export_cameras(cameras, output_dir, **kwargs):
+    """Exports each camera to "output_dir/camera name.fspy"
+    
+    Returns:
+    --------
+    list
+        The paths of the written files
+    """
+    project_paths = []
+    for camera in cameras:
+        project_path = os.path.join(output_dir, '{0}.fspy'.format(camera.nodeName().replace(':', '_')))
+        export_camera(camera, project_path, **kwargs)
+        project_paths.append(project_path)
         
-        image_plane_shape.imageName.set(image_path, type='string')
+    return project_paths
 
 
-def run():
+def run(guide=False, vanishing_lines=False, undoable=True):
     fileFilter =  'fspy Files (*.fspy)'
     result = pm.fileDialog2(fileFilter=fileFilter, dialogStyle=1, fileMode=1)
     if result:
@@ -131,14 +635,6 @@ def run():
         if len(cameras) > 1:
             pm.error("Only one camera can be selected.")
         
-        if not cameras:
-            camera_shape = pm.createNode('camera', n='fspy_camera')
-            camera = camera_shape.getParent()
-            
-        else:
-            camera = cameras[0]
-        
-
         project_path = result[0]
         try:
             project =  fspy.Project(project_path)
@@ -146,5 +642,17 @@ def run():
             print(e)
             return
         
-        set_camera(project, camera)
+        with import_transaction(undoable):
+            if not cameras:
+                camera_shape = pm.createNode('camera', n='fspy_camera')
+                camera = camera_shape.getParent()
+                
+            else:
+                camera = cameras[0]
+            
+            set_camera(project, camera)
+            if guide:
+                create_guide(project)
+            if vanishing_lines:
+                create_vanishing_lines(project, camera)
     
\ No newline at end of file
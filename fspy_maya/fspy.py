@@ -18,46 +18,332 @@
 ##This is a modified version of the official fSpy-blender fspy.py file.
 
 import os
+import io
 import json
+import math
+import shutil
+import zipfile
+import hashlib
 from struct import *
 
+FILE_ID = 2037412710
+PROJECT_VERSION = 1
+HEADER_FORMAT = '<IIII'
+HEADER_SIZE = calcsize(HEADER_FORMAT)
+
+#bytes per read when copying an image into a project file
+COPY_CHUNK_SIZE = 1024 * 1024
+
+#the largest sizes a header may claim, real states are a few kilobytes
+MAX_STATE_SIZE = 8 * 1024 * 1024
+MAX_IMAGE_SIZE = 2 * 1024 * 1024 * 1024
+
 class ParsingError(Exception):
     pass
 
+class NotAProjectError(ParsingError):
+    """The header isn't an fSpy header or is from an unsupported version"""
+
+class SizeLimitError(ParsingError):
+    """The header claims a state or image over MAX_STATE_SIZE or MAX_IMAGE_SIZE"""
+
+class TruncatedError(ParsingError):
+    """The file is shorter than its header says"""
+
+class StateError(ParsingError):
+    """The state isn't JSON or is missing, or has malformed, values"""
+
+def _number(value, name):
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise StateError("The fSpy project's {0} isn't a number".format(name))
+    return value
+
 class CameraParameters:
     def __init__(self, json_dict):
         if json_dict is None:
-            raise ParsingError("Trying to import an fSpy project with no camera parameters")
+            raise StateError("Trying to import an fSpy project with no camera parameters")
         principal_point_dict = json_dict["principalPoint"]
-        self.principal_point = (principal_point_dict["x"], principal_point_dict["y"])
-        self.fov_horiz = json_dict["horizontalFieldOfView"]
-        self.fov_vertical = json_dict["verticalFieldOfView"]
+        self.principal_point = (_number(principal_point_dict["x"], 'principal point'),
+                                _number(principal_point_dict["y"], 'principal point'))
+        self.fov_horiz = _number(json_dict["horizontalFieldOfView"], 'horizontal field of view')
+        self.fov_vertical = _number(json_dict["verticalFieldOfView"], 'vertical field of view')
         self.camera_transform = json_dict["cameraTransform"]["rows"]
-        self.image_width = json_dict["imageWidth"]
-        self.image_height = json_dict["imageHeight"]
+        if len(self.camera_transform) != 4 or any(len(row) != 4 for row in self.camera_transform):
+            raise StateError("The fSpy project's camera transform isn't 4x4")
+        for row in self.camera_transform:
+            for value in row:
+                _number(value, 'camera transform')
+        self.image_width = _number(json_dict["imageWidth"], 'image width')
+        self.image_height = _number(json_dict["imageHeight"], 'image height')
+        if self.image_width <= 0 or self.image_height <= 0:
+            raise StateError("The fSpy project's image size isn't positive")
+        self.relative_focal_length = json_dict.get("relativeFocalLength")
+        self.vanishing_points = [(point["x"], point["y"]) for point in json_dict.get("vanishingPoints", [])]
+        self.vanishing_point_axes = json_dict.get("vanishingPointAxes", [])
+
+class ControlPoints:
+    """The user placed control points of an fSpy project.
+
+    All points are in relative image coordinates, (0, 0) being the top left
+    corner of the image and (1, 1) the bottom right.
+    """
+    def __init__(self, state):
+        base = state.get("controlPointsStateBase") or {}
+        self.principal_point = self._point(base.get("principalPoint"))
+        self.origin = self._point(base.get("origin"))
+
+        #a list of line segments for each vanishing point, a segment being a pair of points
+        self.vanishing_lines = [self._segments(base.get("firstVanishingPoint"))]
+        self.horizon = None
+
+        calibration_mode = (state.get("globalSettings") or {}).get("calibrationMode", "1VP")
+        if calibration_mode == "2VP":
+            state_2vp = state.get("controlPointsState2VP") or {}
+            self.vanishing_lines.append(self._segments(state_2vp.get("secondVanishingPoint")))
+            if (state.get("calibrationSettingsBase") or {}).get("principalPointMode") == "FromThirdVanishingPoint":
+                self.vanishing_lines.append(self._segments(state_2vp.get("thirdVanishingPoint")))
+        else:
+            horizon = (state.get("controlPointsState1VP") or {}).get("horizon")
+            if horizon:
+                self.horizon = (self._point(horizon[0]), self._point(horizon[1]))
+
+    @staticmethod
+    def _point(point_dict):
+        if point_dict is None:
+            return None
+        return (point_dict["x"], point_dict["y"])
+
+    @staticmethod
+    def _segments(vanishing_point_dict):
+        if not vanishing_point_dict:
+            return []
+        return [(ControlPoints._point(start), ControlPoints._point(end))
+                for start, end in vanishing_point_dict.get("lineSegments", [])]
+
+def parse_header(header, file_size=None):
+    """Validates the first HEADER_SIZE bytes of a project
+    
+    The claimed sizes are checked against the limits, and file_size when
+    it's known, before anything is allocated for them.
+    
+    Returns:
+    --------
+    tuple
+        (state_string_size, image_buffer_size)
+    """
+    if len(header) < HEADER_SIZE:
+        raise NotAProjectError("Trying to import a file that is not an fSpy project")
+    
+    file_id, project_version, state_string_size, image_buffer_size = unpack_from(HEADER_FORMAT, header)
+    if FILE_ID != file_id:
+        raise NotAProjectError("Trying to import a file that is not an fSpy project")
+    if project_version != PROJECT_VERSION:
+        raise NotAProjectError("Unsupported fSpy project file version " + str(project_version))
+
+    if image_buffer_size == 0:
+        raise ParsingError("Trying to import an fSpy project with no image data")
+    if state_string_size > MAX_STATE_SIZE:
+        raise SizeLimitError("The fSpy project's state claims {0} bytes".format(state_string_size))
+    if image_buffer_size > MAX_IMAGE_SIZE:
+        raise SizeLimitError("The fSpy project's image claims {0} bytes".format(image_buffer_size))
+    if file_size is not None and HEADER_SIZE + state_string_size + image_buffer_size > file_size:
+        raise TruncatedError("The fSpy project is shorter than its header says")
+    
+    return (state_string_size, image_buffer_size)
+
+
+def read_header(path):
+    """Reads just the header of a project file
+    
+    Returns:
+    --------
+    tuple
+        (state_string_size, image_buffer_size)
+    """
+    with open(path, 'rb') as project_file:
+        return parse_header(project_file.read(HEADER_SIZE), os.fstat(project_file.fileno()).st_size)
+
+
+def _get_stream_size(stream):
+    #only real files, seeking to the end of e.g. a zip member would decompress all of it
+    try:
+        return os.fstat(stream.fileno()).st_size - stream.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _read_exactly(stream, size, known_size):
+    """Reads size bytes, in chunks when the stream's length is unknown
+    
+    A hostile header then can't make us allocate more than the stream holds.
+    """
+    if known_size:
+        data = stream.read(size)
+    else:
+        chunks = []
+        remaining = size
+        while remaining:
+            chunk = stream.read(min(remaining, COPY_CHUNK_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b''.join(chunks)
+    if len(data) != size:
+        raise TruncatedError("The fSpy project is shorter than its header says")
+    return data
+
 
 class Project:
-    def __init__(self, project_path):
-        project_file = open(project_path, "rb")
-
-        file_id = unpack('<I', project_file.read(4))[0]
-        if 2037412710 != file_id:
-            raise ParsingError("Trying to import a file that is not an fSpy project")
-        self.project_version = unpack('<I', project_file.read(4))[0]
-        if self.project_version != 1:
-            raise ParsingError("Unsupported fSpy project file version " + str(self.project_version))
-
-        state_string_size = unpack('<I', project_file.read(4))[0]
-        image_buffer_size = unpack('<I', project_file.read(4))[0]
-
-        if image_buffer_size == 0:
-            raise ParsingError("Trying to import an fSpy project with no image data")
-
-        project_file.seek(16)
-        state = json.loads(project_file.read(state_string_size).decode('utf-8'))
-        self.camera_parameters = CameraParameters(state["cameraParameters"])
-        calibration_settings = state["calibrationSettingsBase"]
-        self.reference_distance_unit = calibration_settings["referenceDistanceUnit"]
-        self.image_data = project_file.read(image_buffer_size)
-        self.file_name = os.path.basename(project_path)
-        self.z_up = state['globalSettings']['overlay3DGuide'].lower().find('y') >= 0
\ No newline at end of file
+    """A parsed fSpy project
+    
+    Parameters:
+    -----------
+    source : str, os.PathLike, file-like object or buffer
+        A path to an .fspy file, a binary file-like object (e.g. an open
+        zip member) or any object supporting the buffer protocol (bytes,
+        bytearray, memoryview, mmap...). When reading from a buffer
+        image_data is a memoryview into it rather than a copy.
+    file_name : str
+        Overrides the file name, which is otherwise taken from the source
+    load_image : bool
+        When False the image isn't read and image_data is None
+    """
+    def __init__(self, source, file_name=None, load_image=True):
+        self._content_hash = None
+        self._load_image = load_image
+        self.source_path = None
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as project_file:
+                self._read_file(project_file)
+            file_name = file_name or os.path.basename(source)
+            self.source_path = os.path.abspath(source)
+            
+        elif hasattr(source, 'read'):
+            self._read_file(source)
+            file_name = file_name or os.path.basename(getattr(source, 'name', ''))
+            
+        else:
+            self._read_buffer(memoryview(source).cast('B'))
+            
+        self.file_name = file_name or ''
+        
+    @classmethod
+    def from_zip(cls, archive, member):
+        """Reads a project stored in a zip archive without extracting it
+        
+        Parameters:
+        -----------
+        archive : str or zipfile.ZipFile
+        member : str
+            The project's name inside the archive
+        """
+        if isinstance(archive, zipfile.ZipFile):
+            with archive.open(member) as project_file:
+                return cls(project_file, file_name=os.path.basename(member))
+            
+        with zipfile.ZipFile(archive) as zip_file:
+            return cls.from_zip(zip_file, member)
+        
+    @property
+    def content_hash(self):
+        """The sha256 hex digest of the whole project file, computed on first use
+        
+        None for a buffer or stream read with load_image=False, since the
+        image it needs wasn't kept.
+        """
+        if self._content_hash is None and self.image_data is None:
+            if not self.source_path:
+                return None
+            self._content_hash = file_hash(self.source_path)
+        if self._content_hash is None:
+            digest = hashlib.sha256(self._header)
+            digest.update(self._state_data)
+            digest.update(self.image_data)
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+        
+    def _read_file(self, project_file):
+        stream_size = _get_stream_size(project_file)
+        self._header = project_file.read(HEADER_SIZE)
+        state_string_size, image_buffer_size = parse_header(self._header, stream_size)
+        known_size = stream_size is not None
+        self._read_state(_read_exactly(project_file, state_string_size, known_size), state_string_size)
+        self.image_offset = HEADER_SIZE + state_string_size
+        self.image_size = image_buffer_size
+        if not self._load_image:
+            self.image_data = None
+            return
+        
+        self.image_data = _read_exactly(project_file, image_buffer_size, known_size)
+
+    def _read_buffer(self, view):
+        self._header = bytes(view[:HEADER_SIZE])
+        #header and state only buffers are fine when the image isn't wanted
+        state_string_size, image_buffer_size = parse_header(self._header, len(view) if self._load_image else None)
+        state_end = HEADER_SIZE + state_string_size
+        self._read_state(bytes(view[HEADER_SIZE:state_end]), state_string_size)
+        self.image_offset = state_end
+        self.image_size = image_buffer_size
+        if not self._load_image:
+            self.image_data = None
+            return
+        
+        self.image_data = view[state_end:state_end + image_buffer_size]
+        
+    def _read_state(self, state_data, state_string_size):
+        if len(state_data) != state_string_size:
+            raise TruncatedError("The fSpy project's state is truncated")
+        
+        self._state_data = state_data
+        try:
+            state = json.loads(state_data.decode('utf-8'))
+        except (ValueError, RecursionError) as e:
+            raise StateError("The fSpy project's state isn't valid JSON: {0}".format(e)) from None
+        
+        try:
+            self.project_version = PROJECT_VERSION
+            self.state = state
+            self.camera_parameters = CameraParameters(state["cameraParameters"])
+            calibration_settings = state["calibrationSettingsBase"]
+            self.reference_distance_unit = str(calibration_settings["referenceDistanceUnit"])
+            self.reference_distance = calibration_settings.get("referenceDistance", 1.0)
+            self.control_points = ControlPoints(state)
+            self.overlay_3d_guide = state['globalSettings']['overlay3DGuide']
+            self.z_up = self.overlay_3d_guide.lower().find('y') >= 0
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            raise StateError("The fSpy project's state is missing or has a malformed {0}".format(e)) from None
+
+def file_hash(path, chunk_size=COPY_CHUNK_SIZE):
+    """Returns the sha256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_project(project_path, state, image_path, chunk_size=COPY_CHUNK_SIZE):
+    """Writes a version 1 fSpy project file
+    
+    The header and state are written in one go, then the image is copied
+    from disk in chunks so it's never fully loaded into memory.
+    
+    Parameters:
+    -----------
+    project_path : str
+        The .fspy file to write
+    state : dict
+        The project state. It must at least hold what Project reads.
+    image_path : str
+        The image file to embed
+    """
+    state_data = json.dumps(state).encode('utf-8')
+    image_buffer_size = os.path.getsize(image_path)
+    if image_buffer_size == 0:
+        raise ValueError("Can't write an fSpy project with no image data")
+    
+    header = pack(HEADER_FORMAT, FILE_ID, PROJECT_VERSION, len(state_data), image_buffer_size)
+    with open(project_path, 'wb') as project_file, open(image_path, 'rb') as image_file:
+        project_file.write(header + state_data)
+        shutil.copyfileobj(image_file, project_file, chunk_size)
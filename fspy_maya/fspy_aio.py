@@ -0,0 +1,78 @@
+"""asyncio loading of many fSpy projects, for shares where every open and read is slow"""
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fspy_maya import fspy
+
+
+#bytes read with the header, enough for the state of almost every project
+PREFETCH_SIZE = 64 * 1024
+
+
+def _read_project(path, load_image, prefetch_size):
+    #one read gets the header and (usually) the whole state, one more gets the rest
+    with open(path, 'rb') as project_file:
+        data = project_file.read(prefetch_size)
+        state_string_size, image_buffer_size = fspy.parse_header(data, os.fstat(project_file.fileno()).st_size)
+        needed = fspy.HEADER_SIZE + state_string_size
+        if load_image:
+            needed += image_buffer_size
+        if len(data) < needed:
+            #read the rest straight into place, rather than copying the plate onto the prefetch
+            buffer = bytearray(needed)
+            buffer[:len(data)] = data
+            view = memoryview(buffer)
+            filled = len(data)
+            while filled < needed:
+                count = project_file.readinto(view[filled:])
+                if not count:
+                    break
+                filled += count
+            #a short buffer is reported as truncated by Project
+            data = view[:filled]
+
+    project = fspy.Project(data, file_name=os.path.basename(path), load_image=load_image)
+    project.source_path = os.path.abspath(path)
+    return project
+
+
+async def load(path, load_image=True, executor=None, prefetch_size=PREFETCH_SIZE):
+    """Reads one project without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _read_project, path, load_image, prefetch_size)
+
+
+async def load_many(paths, limit=16, load_image=True, prefetch_size=PREFETCH_SIZE):
+    """Reads projects concurrently and yields each one as soon as it's done
+    
+    Example:
+        async for project in fspy_aio.load_many(paths, limit=32):
+            print(project.source_path)
+    
+    Parameters:
+    -----------
+    limit : int
+        The most files open at once
+    load_image : bool
+        False skips the images, which is all most batch jobs need
+        
+    Raises the first error hit, after cancelling the loads that haven't started.
+    """
+    executor = ThreadPoolExecutor(max_workers=limit)
+    tasks = [asyncio.ensure_future(load(path, load_image, executor, prefetch_size)) for path in paths]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        #waiting for reads that already started would block the event loop
+        executor.shutdown(wait=False)
+
+
+def load_all(paths, limit=16, load_image=True):
+    """Blocking wrapper around load_many(), returns the projects in completion order"""
+    async def collect():
+        return [project async for project in load_many(paths, limit, load_image)]
+    return asyncio.run(collect())
@@ -1,15 +1,35 @@
 
+import os
+import sys
+import threading
+
 import maya.OpenMaya
 import maya.OpenMayaUI
 import maya.OpenMayaMPx
+import maya.utils
 
 import pymel.core as pm
 
 import fspy_maya
+from fspy_maya import plate_loader
 
 CAMERA_NAME = 'fspy_camera'
 PLUGIN_NAME = 'fSpy Importer'
 
+#e.g. cmds.file(path, i=True, type=PLUGIN_NAME, options='guide=1;vanishing_lines=1')
+#undo=0 skips undo recording for headless batch imports
+#live=1 keeps the camera driven by an fspyCamera node that follows the file
+#defer=1 leaves the plate in the .fspy until a panel looks through the camera
+DEFAULT_OPTIONS = 'guide=0;vanishing_lines=0;undo=1;live=0;defer=0'
+
+NODE_NAME = fspy_maya.CAMERA_NODE_TYPE
+#0x00000-0x7ffff is the range Autodesk leaves for in-house nodes
+NODE_ID = maya.OpenMaya.MTypeId(0x0007F5A1)
+
+#scene messages that can bring in cameras with deferred plates
+SCENE_MESSAGES = [maya.OpenMaya.MSceneMessage.kAfterOpen, maya.OpenMaya.MSceneMessage.kAfterImport]
+_CALLBACK_IDS = []
+
 #https://help.autodesk.com/view/MAYAUL/2023/ENU/?guid=Maya_SDK_Writing_File_Translators_File_Translator_Examples_html
 #https://download.autodesk.com/us/maya/2010help/API/class_m_fn_plugin.html#eb13e594951a71b750927ac44ddd4983
 #https://download.autodesk.com/us/maya/2010help/API/class_m_px_file_translator.html
@@ -35,6 +55,17 @@ class fSpy_Importer( maya.OpenMayaMPx.MPxFileTranslator ):
     def haveReadMethod(self, *args):
         return True
     
+    @staticmethod
+    def parse_options(option_string):
+        """Converts a 'name=value;name=value' option string into a dict of bools"""
+        options = {}
+        for option in option_string.split(';'):
+            if '=' in option:
+                name, value = option.split('=', 1)
+                options[name.strip()] = value.strip() not in ('', '0', 'false', 'False')
+                
+        return options
+    
     def reader(self, fileObject, option_string, mode):
         selection = pm.ls(sl=True, type='transform')
         
@@ -51,27 +82,235 @@ class fSpy_Importer( maya.OpenMayaMPx.MPxFileTranslator ):
             pm.confirmDialog( title='fSpy Import Error', message=error_message, button=['Okay'] )
             pm.error(error_message)
         
-        if not cameras:
-            try:
-                camera = pm.general.PyNode(CAMERA_NAME)
-            except: 
-                camera_shape = pm.createNode('camera')
-                camera = camera_shape.getParent()
-                pm.general.rename(camera, CAMERA_NAME)   
-        else:
-            camera = cameras[0]         
-        
-        
+        options = self.parse_options(DEFAULT_OPTIONS)
+        options.update(self.parse_options(option_string or ''))
         file_name = fileObject.resolvedFullName()
         try:
-            project =  fspy_maya.fspy.Project(file_name)
-            fspy_maya.set_camera(project, camera)
+            project =  fspy_maya.fspy.Project(file_name, load_image=not options['defer'])
+            
+            with fspy_maya.import_transaction(options['undo']):
+                if not cameras:
+                    try:
+                        camera = pm.general.PyNode(CAMERA_NAME)
+                    except: 
+                        camera_shape = pm.createNode('camera')
+                        camera = camera_shape.getParent()
+                        pm.general.rename(camera, CAMERA_NAME)   
+                else:
+                    camera = cameras[0]         
+                
+                fspy_maya.set_camera(project, camera, defer_plate=options['defer'])
+                if options['guide']:
+                    fspy_maya.create_guide(project)
+                if options['vanishing_lines']:
+                    fspy_maya.create_vanishing_lines(project, camera)
+                if options['live']:
+                    fspy_maya.connect_camera_node(camera, file_name)
         except Exception as e:
             sys.stderr.write( "Failed to read file information\n")
             pm.error(e)
             raise
     
     
+class ProjectCache:
+    """Parsed projects by path, re-read only when a file's size or modification time changes
+    
+    compute() runs on several threads under the parallel evaluation
+    manager, so the cache is locked. Paths that failed to read are kept
+    until they read again, so each failure is only reported once.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._projects = {}
+        self._failed = set()
+        
+    def first_failure(self, path):
+        """True the first time path fails to read since it last read fine"""
+        with self._lock:
+            if path in self._failed:
+                return False
+            self._failed.add(path)
+            return True
+        
+    def get(self, path):
+        stat = os.stat(path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._projects.get(path)
+        if entry and entry[0] == stamp:
+            return entry[1]
+        
+        #parse outside the lock so a slow file doesn't hold up the other nodes
+        project = fspy_maya.fspy.Project(path, load_image=False)
+        with self._lock:
+            self._projects[path] = (stamp, project)
+            self._failed.discard(path)
+        return project
+    
+PROJECT_CACHE = ProjectCache()
+
+
+class fSpy_Camera( maya.OpenMayaMPx.MPxNode ):
+    """Computes a camera's transform and lens from an .fspy file
+    
+    Nothing is read until an output is pulled, and the file is only parsed
+    again when its path or stamp changes. When that happens in an
+    interactive session the camera's plate is refreshed too.
+    """
+    file_path = maya.OpenMaya.MObject()
+    horizontal_aperture = maya.OpenMaya.MObject()
+    up_axis = maya.OpenMaya.MObject()
+    
+    out_translate = maya.OpenMaya.MObject()
+    out_rotate = maya.OpenMaya.MObject()
+    out_focal_length = maya.OpenMaya.MObject()
+    out_horizontal_fov = maya.OpenMaya.MObject()
+    out_vertical_fov = maya.OpenMaya.MObject()
+    out_vertical_aperture = maya.OpenMaya.MObject()
+    out_horizontal_offset = maya.OpenMaya.MObject()
+    out_vertical_offset = maya.OpenMaya.MObject()
+    outputs = []
+    
+    def __init__(self):
+        maya.OpenMayaMPx.MPxNode.__init__(self)
+        #the project the last compute() read, to notice a new file
+        self._project = None
+        
+    def schedulingType(self):
+        #compute() only touches its own data block and the locked PROJECT_CACHE
+        return maya.OpenMayaMPx.MPxNode.kParallel
+    
+    def compute(self, plug, data):
+        attribute = plug.parent().attribute() if plug.isChild() else plug.attribute()
+        if not any(attribute == output for output in fSpy_Camera.outputs):
+            return maya.OpenMaya.kUnknownParameter
+        
+        path = data.inputValue(fSpy_Camera.file_path).asString()
+        horizontal_aperture = data.inputValue(fSpy_Camera.horizontal_aperture).asDouble()
+        maya_up_axis = 'z' if data.inputValue(fSpy_Camera.up_axis).asShort() == 1 else 'y'
+        
+        project = None
+        if path:
+            try:
+                project = PROJECT_CACHE.get(path)
+            except (OSError, ValueError, KeyError, fspy_maya.fspy.ParsingError) as e:
+                #a missing or broken file leaves the camera at the origin until the path is fixed
+                if PROJECT_CACHE.first_failure(path):
+                    sys.stderr.write("fspyCamera couldn't read {0}: {1}\n".format(path, e))
+        
+        if project is not None and project is not self._project:
+            #the first read after creation or scene open matches the plate already on the camera
+            if self._project is not None and maya.OpenMaya.MGlobal.mayaState() == maya.OpenMaya.MGlobal.kInteractive:
+                #scene edits can't happen during evaluation
+                node_name = maya.OpenMaya.MFnDependencyNode(self.thisMObject()).name()
+                maya.utils.executeDeferred(fspy_maya.refresh_plate, node_name)
+            self._project = project
+        
+        if project is None:
+            values = fspy_maya.conversion.CameraValues((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), 35.0, 0.0, 0.0,
+                                                       horizontal_aperture, horizontal_aperture, 0.0, 0.0)
+        else:
+            values = fspy_maya.conversion.get_camera_values(project, horizontal_aperture, maya_up_axis)
+            
+        data.outputValue(fSpy_Camera.out_translate).set3Double(*values.translate)
+        data.outputValue(fSpy_Camera.out_rotate).set3Double(*values.rotate)
+        for output, value in zip(fSpy_Camera.outputs[2:], [values.focal_length, values.horizontal_fov,
+                                                           values.vertical_fov, values.vertical_aperture,
+                                                           values.horizontal_offset, values.vertical_offset]):
+            data.outputValue(output).setDouble(value)
+            
+        for output in fSpy_Camera.outputs:
+            data.setClean(output)
+            
+            
+class fSpy_ApiUndo( maya.OpenMayaMPx.MPxCommand ):
+    """Runs the pending core.ApiOperation so the nodes it makes can be undone and redone"""
+    def __init__(self):
+        maya.OpenMayaMPx.MPxCommand.__init__(self)
+        self.operation = None
+        
+    def doIt(self, args):
+        self.operation = fspy_maya.pop_pending_operation()
+        self.operation.doIt()
+        
+    def redoIt(self):
+        self.operation.doIt()
+        
+    def undoIt(self):
+        self.operation.undoIt()
+        
+    def isUndoable(self):
+        return True
+    
+    
+def command_creator():
+    return maya.OpenMayaMPx.asMPxPtr( fSpy_ApiUndo() )
+
+
+def node_creator():
+    return maya.OpenMayaMPx.asMPxPtr( fSpy_Camera() )
+
+
+def node_initializer():
+    typed_attr = maya.OpenMaya.MFnTypedAttribute()
+    numeric_attr = maya.OpenMaya.MFnNumericAttribute()
+    unit_attr = maya.OpenMaya.MFnUnitAttribute()
+    enum_attr = maya.OpenMaya.MFnEnumAttribute()
+    
+    fSpy_Camera.file_path = typed_attr.create('filePath', 'fp', maya.OpenMaya.MFnData.kString)
+    typed_attr.setUsedAsFilename(True)
+    fSpy_Camera.horizontal_aperture = numeric_attr.create('horizontalFilmAperture', 'hfa',
+                                                          maya.OpenMaya.MFnNumericData.kDouble,
+                                                          fspy_maya.conversion.DEFAULT_HORIZONTAL_APERTURE)
+    fSpy_Camera.up_axis = enum_attr.create('upAxis', 'up', 0)
+    enum_attr.addField('y', 0)
+    enum_attr.addField('z', 1)
+    inputs = [fSpy_Camera.file_path, fSpy_Camera.horizontal_aperture, fSpy_Camera.up_axis]
+    
+    def make_output(attr_fn):
+        attr_fn.setWritable(False)
+        attr_fn.setStorable(False)
+    
+    fSpy_Camera.out_translate = numeric_attr.create('outTranslate', 'otr', maya.OpenMaya.MFnNumericData.k3Double)
+    make_output(numeric_attr)
+    
+    rotate_children = []
+    for axis in 'XYZ':
+        rotate_children.append(unit_attr.create('outRotate' + axis, 'or' + axis.lower(),
+                                                maya.OpenMaya.MFnUnitAttribute.kAngle, 0.0))
+        make_output(unit_attr)
+    fSpy_Camera.out_rotate = numeric_attr.create('outRotate', 'oro', *rotate_children)
+    make_output(numeric_attr)
+    
+    def double_output(name, short_name):
+        attr = numeric_attr.create(name, short_name, maya.OpenMaya.MFnNumericData.kDouble, 0.0)
+        make_output(numeric_attr)
+        return attr
+    
+    def angle_output(name, short_name):
+        attr = unit_attr.create(name, short_name, maya.OpenMaya.MFnUnitAttribute.kAngle, 0.0)
+        make_output(unit_attr)
+        return attr
+    
+    fSpy_Camera.out_focal_length = double_output('outFocalLength', 'ofl')
+    fSpy_Camera.out_horizontal_fov = angle_output('outHorizontalFieldOfView', 'ohfv')
+    fSpy_Camera.out_vertical_fov = angle_output('outVerticalFieldOfView', 'ovfv')
+    fSpy_Camera.out_vertical_aperture = double_output('outVerticalFilmAperture', 'ovfa')
+    fSpy_Camera.out_horizontal_offset = double_output('outHorizontalFilmOffset', 'ohfo')
+    fSpy_Camera.out_vertical_offset = double_output('outVerticalFilmOffset', 'ovfo')
+    
+    fSpy_Camera.outputs = [fSpy_Camera.out_translate, fSpy_Camera.out_rotate,
+                           fSpy_Camera.out_focal_length, fSpy_Camera.out_horizontal_fov,
+                           fSpy_Camera.out_vertical_fov, fSpy_Camera.out_vertical_aperture,
+                           fSpy_Camera.out_horizontal_offset, fSpy_Camera.out_vertical_offset]
+    
+    for attr in inputs + fSpy_Camera.outputs:
+        fSpy_Camera.addAttribute(attr)
+    for input_attr in inputs:
+        for output in fSpy_Camera.outputs:
+            fSpy_Camera.attributeAffects(input_attr, output)
+    
+    
 # creator
 def creator():
     return maya.OpenMayaMPx.asMPxPtr( fSpy_Importer() )
@@ -81,17 +320,50 @@ def initializePlugin(mobject):
     plugin = maya.OpenMayaMPx.MFnPlugin(mobject, "Autodesk", "1.0", "Any")
 
     try:
-        plugin.registerFileTranslator(PLUGIN_NAME, '', creator)
+        plugin.registerFileTranslator(PLUGIN_NAME, '', creator, None, DEFAULT_OPTIONS)
     except:
         sys.stderr.write("Failed to register node:{0}".format(PLUGIN_NAME))
         raise
 
+    try:
+        plugin.registerNode(NODE_NAME, NODE_ID, node_creator, node_initializer)
+    except:
+        sys.stderr.write("Failed to register node:{0}".format(NODE_NAME))
+        raise
+
+    try:
+        plugin.registerCommand(fspy_maya.API_UNDO_COMMAND, command_creator)
+    except:
+        sys.stderr.write("Failed to register command:{0}".format(fspy_maya.API_UNDO_COMMAND))
+        raise
+
+    #a saved scene with deferred plates extracts them again once it's reopened
+    for message in SCENE_MESSAGES:
+        _CALLBACK_IDS.append(maya.OpenMaya.MSceneMessage.addCallback(message, plate_loader.watch_pending))
+
 # uninitialize the script plug-in
 def uninitializePlugin( mobject ):
     plugin = maya.OpenMayaMPx.MFnPlugin( mobject )
 
+    for callback_id in _CALLBACK_IDS:
+        maya.OpenMaya.MMessage.removeCallback(callback_id)
+    del _CALLBACK_IDS[:]
+    plate_loader.stop_watching()
+
     try:
         plugin.deregisterFileTranslator(PLUGIN_NAME)
     except:
         sys.stderr.write("Failed to unregister node:{0}".format(PLUGIN_NAME))
+        raise
+
+    try:
+        plugin.deregisterNode(NODE_ID)
+    except:
+        sys.stderr.write("Failed to unregister node:{0}".format(NODE_NAME))
+        raise
+
+    try:
+        plugin.deregisterCommand(fspy_maya.API_UNDO_COMMAND)
+    except:
+        sys.stderr.write("Failed to unregister command:{0}".format(fspy_maya.API_UNDO_COMMAND))
         raise
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""Fuzzes the .fspy parser with synthetic and mutated projects
+
+Every input is parsed from a buffer, from a stream of unknown length and
+from a file. Anything raising something other than fspy.ParsingError,
+or taking longer or allocating more than the limits, is a failure.
+
+example: python -m fspy_maya.fuzz --iterations 20000 --seed 1
+"""
+import io
+import os
+import sys
+import copy
+import json
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+import collections
+from struct import *
+
+from fspy_maya import fspy
+
+
+#an input that broke a limit or raised the wrong exception
+FuzzFailure = collections.namedtuple('FuzzFailure', ['mutation', 'source', 'error', 'seconds', 'peak_bytes', 'data'])
+
+#the worst time and allocation seen for each mutation
+FuzzStats = collections.namedtuple('FuzzStats', ['count', 'worst_seconds', 'worst_peak_bytes'])
+
+#values the header's size fields get overwritten with
+HOSTILE_SIZES = [0, 1, 2, 0x7fffffff, 0xffffffff, fspy.MAX_STATE_SIZE, fspy.MAX_STATE_SIZE + 1,
+                 fspy.MAX_IMAGE_SIZE, fspy.MAX_IMAGE_SIZE + 1]
+
+#values JSON fields get swapped for
+HOSTILE_VALUES = [None, True, 0, -1, 1e308, float('nan'), '', 'x' * 1000, [], {}, [[]] * 4, {'x': 'y'}]
+
+
+def make_state():
+    """Returns a small, valid 2VP project state"""
+    point = lambda x, y: {'x': x, 'y': y}
+    segments = lambda *pairs: {'lineSegments': [[point(*start), point(*end)] for start, end in pairs]}
+    return {
+        'cameraParameters': {
+            'principalPoint': point(0.0, 0.0),
+            'horizontalFieldOfView': 1.0,
+            'verticalFieldOfView': 0.6,
+            'cameraTransform': {'rows': [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 5], [0, 0, 0, 1]]},
+            'imageWidth': 1920,
+            'imageHeight': 1080,
+            'relativeFocalLength': 1.8,
+            'vanishingPoints': [point(1, 0), point(-1, 0), point(0, 1)],
+            'vanishingPointAxes': ['xPositive', 'zNegative', 'yPositive'],
+        },
+        'calibrationSettingsBase': {'referenceDistanceUnit': 'Meters', 'referenceDistance': 1.0},
+        'controlPointsStateBase': {'principalPoint': point(0.5, 0.5), 'origin': point(0.5, 0.6),
+                                   'firstVanishingPoint': segments(((0.1, 0.1), (0.2, 0.3)))},
+        'controlPointsState2VP': {'secondVanishingPoint': segments(((0.9, 0.1), (0.8, 0.3)))},
+        'globalSettings': {'calibrationMode': '2VP', 'overlay3DGuide': 'xyGridPlane'},
+    }
+
+
+def make_project(state=None, image=b'\x89PNG\r\n\x1a\n' + b'\0' * 64):
+    state_data = json.dumps(state if state is not None else make_state()).encode('utf-8')
+    return pack(fspy.HEADER_FORMAT, fspy.FILE_ID, fspy.PROJECT_VERSION, len(state_data), len(image)) + state_data + image
+
+
+def _get_paths(value, path=()):
+    yield path
+    if isinstance(value, dict):
+        for key, child in value.items():
+            for child_path in _get_paths(child, path + (key,)):
+                yield child_path
+    elif isinstance(value, list):
+        for idx, child in enumerate(value):
+            for child_path in _get_paths(child, path + (idx,)):
+                yield child_path
+
+
+def _mutate_state(rng):
+    state = make_state()
+    paths = [path for path in _get_paths(state) if path]
+    for path in rng.sample(paths, rng.randint(1, 3)):
+        parent = state
+        try:
+            for key in path[:-1]:
+                parent = parent[key]
+            if rng.random() < 0.3:
+                del parent[path[-1]]
+            else:
+                parent[path[-1]] = copy.deepcopy(rng.choice(HOSTILE_VALUES))
+        except (KeyError, IndexError, TypeError):
+            #an earlier mutation removed or replaced this path
+            pass
+    return make_project(state)
+
+
+def _mutate_header(rng):
+    data = bytearray(make_project())
+    field = rng.choice([2, 3])
+    pack_into('<I', data, field * 4, rng.choice(HOSTILE_SIZES + [rng.getrandbits(32)]))
+    return bytes(data)
+
+
+def _mutate_bytes(rng):
+    data = bytearray(make_project())
+    for _ in range(rng.randint(1, 8)):
+        data[rng.randrange(len(data))] = rng.getrandbits(8)
+    return bytes(data)
+
+
+def _truncate(rng):
+    data = make_project()
+    return data[:rng.randrange(len(data))]
+
+
+def _nest(rng):
+    #a state of deeply nested arrays, to blow the JSON parser's stack
+    depth = rng.choice([100, 10000, 1000000])
+    state_data = b'[' * depth + b']' * depth
+    image = b'\0' * 16
+    return pack(fspy.HEADER_FORMAT, fspy.FILE_ID, fspy.PROJECT_VERSION, len(state_data), len(image)) + state_data + image
+
+
+def _garbage(rng):
+    return bytes(rng.getrandbits(8) for _ in range(rng.randrange(0, 256)))
+
+
+MUTATIONS = {
+    'state': _mutate_state,
+    'header': _mutate_header,
+    'bytes': _mutate_bytes,
+    'truncate': _truncate,
+    'nest': _nest,
+    'garbage': _garbage,
+}
+
+
+class _UnknownLengthStream(io.RawIOBase):
+    #like a zip member or socket, no fileno() so the parser can't know the length
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._stream.readinto(buffer)
+
+
+def _parse(source, data, path):
+    if source == 'buffer':
+        fspy.Project(data)
+    elif source == 'stream':
+        fspy.Project(io.BufferedReader(_UnknownLengthStream(data)))
+    else:
+        fspy.Project(path)
+
+
+def run(iterations=1000, seed=0, max_seconds=0.5, max_peak_bytes=64 * 1024 * 1024):
+    """Parses iterations mutated projects from every source
+
+    Returns:
+    --------
+    tuple
+        (a FuzzStats per mutation, a list of FuzzFailure)
+    """
+    rng = random.Random(seed)
+    stats = {}
+    failures = []
+    handle, path = tempfile.mkstemp(suffix='.fspy')
+    os.close(handle)
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            mutation = rng.choice(sorted(MUTATIONS))
+            data = MUTATIONS[mutation](rng)
+            with open(path, 'wb') as project_file:
+                project_file.write(data)
+
+            for source in ('buffer', 'stream', 'file'):
+                error = None
+                tracemalloc.reset_peak()
+                start_size = tracemalloc.get_traced_memory()[0]
+                start = time.perf_counter()
+                try:
+                    _parse(source, data, path)
+                except fspy.ParsingError:
+                    pass
+                except Exception as e:
+                    error = '{0}: {1}'.format(type(e).__name__, e)
+                seconds = time.perf_counter() - start
+                peak_bytes = tracemalloc.get_traced_memory()[1] - start_size
+
+                count, worst_seconds, worst_peak_bytes = stats.get(mutation, (0, 0.0, 0))
+                stats[mutation] = FuzzStats(count + 1, max(worst_seconds, seconds), max(worst_peak_bytes, peak_bytes))
+                if error is None and seconds > max_seconds:
+                    error = 'took {0:.3f}s'.format(seconds)
+                if error is None and peak_bytes > max_peak_bytes:
+                    error = 'allocated {0} bytes'.format(peak_bytes)
+                if error:
+                    failures.append(FuzzFailure(mutation, source, error, seconds, peak_bytes, data))
+    finally:
+        tracemalloc.stop()
+        os.remove(path)
+    return stats, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fuzz the .fspy parser')
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-seconds', type=float, default=0.5, help='the slowest a single parse may be')
+    parser.add_argument('--max-bytes', type=int, default=64 * 1024 * 1024, help='the most a single parse may allocate')
+    parser.add_argument('--save-failures', default='', help='write failing inputs to this folder')
+    args = parser.parse_args(argv)
+
+    stats, failures = run(args.iterations, args.seed, args.max_seconds, args.max_bytes)
+    for mutation, stat in sorted(stats.items()):
+        print('{0:<10} {1:>7} parses, worst {2:.6f}s, {3} bytes'.format(mutation, stat.count, stat.worst_seconds,
+                                                                      stat.worst_peak_bytes))
+    for idx, failure in enumerate(failures):
+        print('FAILED {0} from {1}: {2}'.format(failure.mutation, failure.source, failure.error))
+        if args.save_failures:
+            os.makedirs(args.save_failures, exist_ok=True)
+            with open(os.path.join(args.save_failures, '{0}_{1}.fspy'.format(idx, failure.mutation)), 'wb') as f:
+                f.write(failure.data)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""Converts fSpy projects to Maya ASCII and USD ASCII cameras without Maya
+
+example: python -m fspy_maya.headless shots/ converted/ --up-axis z --workers 8
+"""
+import os
+import re
+import math
+import glob
+import argparse
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+from fspy_maya import fspy
+from fspy_maya import conversion
+from fspy_maya.plate_cache import get_image_extension
+
+
+FORMATS = ('ma', 'usda')
+
+#bytes buffered per output file before it's flushed
+WRITE_BUFFER_SIZE = 64 * 1024
+
+MAYA_ASCII_HEADER = '''//Maya ASCII 2020 scene
+requires maya "2020";
+currentUnit -l centimeter -a degree -t film;
+'''
+
+ConversionResult = collections.namedtuple('ConversionResult', ['path', 'outputs', 'error'])
+
+
+def get_node_name(file_name):
+    """Turns a file name into a valid Maya node or USD prim name"""
+    name = re.sub(r'\W', '_', os.path.splitext(os.path.basename(file_name))[0])
+    if not name or name[0].isdigit():
+        name = '_' + name
+    return name
+
+
+def get_output_names(paths, input_dir):
+    """Returns a name per project for its outputs, relative to input_dir and without an extension
+
+    Names mirror the projects' folders, e.g. a/shot_010 for
+    input_dir/a/shot_010.fspy. When two projects would still share a name,
+    e.g. "shot 1.fspy" and "shot_1.fspy", the second one's name is None so
+    it can fail rather than overwrite the first one's outputs.
+    """
+    names = []
+    taken = set()
+    for path in paths:
+        name = os.path.join(os.path.dirname(os.path.relpath(path, input_dir)), get_node_name(path))
+        key = os.path.normcase(name)
+        names.append(None if key in taken else name)
+        taken.add(key)
+    return names
+
+
+def _format_floats(values):
+    return ' '.join(repr(float(value)) for value in values)
+
+
+def write_maya_ascii(project, stream, name, image_path='', maya_up_axis='y',
+                     horizontal_aperture=conversion.DEFAULT_HORIZONTAL_APERTURE):
+    """Writes the camera, and an image plane when there's an image_path, as .ma commands
+
+    Only the nodes are written, so the result can be appended to other .ma
+    snippets. The values assume currentUnit -l centimeter -a degree, and
+    the scene's up-axis has to be set to maya_up_axis when it's opened.
+    """
+    values = conversion.get_camera_values(project, horizontal_aperture, maya_up_axis)
+    camera_shape = name + 'Shape'
+    stream.write('createNode transform -n "{0}";\n'.format(name))
+    stream.write('\tsetAttr ".t" -type "double3" {0} ;\n'.format(_format_floats(values.translate)))
+    stream.write('\tsetAttr ".r" -type "double3" {0} ;\n'.format(
+        _format_floats(math.degrees(value) for value in values.rotate)))
+    stream.write('createNode camera -n "{0}" -p "{1}";\n'.format(camera_shape, name))
+    stream.write('\tsetAttr -k off ".v";\n')
+    stream.write('\tsetAttr ".cap" -type "double2" {0} ;\n'.format(
+        _format_floats([values.horizontal_aperture, values.vertical_aperture])))
+    stream.write('\tsetAttr ".fl" {0};\n'.format(repr(values.focal_length)))
+    stream.write('\tsetAttr ".hfo" {0};\n'.format(repr(values.horizontal_offset)))
+    stream.write('\tsetAttr ".vfo" {0};\n'.format(repr(values.vertical_offset)))
+
+    if image_path:
+        params = project.camera_parameters
+        image_plane = name + '_imagePlane'
+        image_plane_shape = image_plane + 'Shape'
+        stream.write('createNode transform -n "{0}" -p "{1}";\n'.format(image_plane, camera_shape))
+        stream.write('createNode imagePlane -n "{0}" -p "{1}";\n'.format(image_plane_shape, image_plane))
+        stream.write('\tsetAttr ".imn" -type "string" "{0}";\n'.format(image_path.replace('\\', '/')))
+        stream.write('\tsetAttr ".cov" -type "short2" {0} {1} ;\n'.format(params.image_width, params.image_height))
+        stream.write('\tsetAttr ".o" -type "double2" {0} ;\n'.format(
+            _format_floats([values.horizontal_offset, values.vertical_offset])))
+        stream.write('connectAttr "{0}.msg" "{1}.ip" -na;\n'.format(image_plane_shape, camera_shape))
+
+
+def write_usda(project, stream, name, image_path='', maya_up_axis='y',
+               horizontal_aperture=conversion.DEFAULT_HORIZONTAL_APERTURE):
+    """Writes a USD ASCII layer holding one Camera prim
+
+    The layer is in centimeters, so USD's tenth of a unit lens values are millimeters.
+    The image path is kept in the prim's customData since USD has no image plane.
+    """
+    values = conversion.get_camera_values(project, horizontal_aperture, maya_up_axis)
+    matrix = conversion.get_maya_matrix(project, maya_up_axis)
+    stream.write('#usda 1.0\n(\n')
+    stream.write('    defaultPrim = "{0}"\n'.format(name))
+    stream.write('    metersPerUnit = 0.01\n')
+    stream.write('    upAxis = "{0}"\n)\n\n'.format(maya_up_axis.upper()))
+    stream.write('def Camera "{0}" (\n'.format(name))
+    stream.write('    customData = {{\n        string fspyImage = "{0}"\n    }}\n)\n{{\n'.format(
+        image_path.replace('\\', '/')))
+    stream.write('    matrix4d xformOp:transform = ( {0} )\n'.format(
+        ', '.join('({0})'.format(', '.join(repr(float(value)) for value in row)) for row in matrix)))
+    stream.write('    uniform token[] xformOpOrder = ["xformOp:transform"]\n')
+    stream.write('    token projection = "perspective"\n')
+    stream.write('    float focalLength = {0}\n'.format(repr(values.focal_length)))
+    stream.write('    float horizontalAperture = {0}\n'.format(repr(values.horizontal_aperture * 25.4)))
+    stream.write('    float verticalAperture = {0}\n'.format(repr(values.vertical_aperture * 25.4)))
+    stream.write('    float horizontalApertureOffset = {0}\n'.format(repr(values.horizontal_offset * 25.4)))
+    stream.write('    float verticalApertureOffset = {0}\n'.format(repr(values.vertical_offset * 25.4)))
+    stream.write('}\n')
+
+
+def convert_file(path, output_dir, formats=FORMATS, extract_image=True, maya_up_axis='y'):
+    """Writes a .ma and/or .usda camera for one .fspy file
+
+    Parameters:
+    -----------
+    extract_image : bool
+        Writes the project's image next to the outputs and references it
+
+    Returns:
+    --------
+    list
+        The paths written
+    """
+    project = fspy.Project(path, load_image=extract_image)
+    name = get_node_name(path)
+    outputs = []
+
+    image_path = ''
+    if extract_image:
+        extension = get_image_extension(project.image_data) or 'img'
+        image_path = os.path.join(output_dir, '{0}.{1}'.format(name, extension))
+        with open(image_path, 'wb') as image_file:
+            image_file.write(project.image_data)
+        outputs.append(image_path)
+
+    if 'ma' in formats:
+        ma_path = os.path.join(output_dir, name + '.ma')
+        with open(ma_path, 'w', buffering=WRITE_BUFFER_SIZE) as stream:
+            stream.write(MAYA_ASCII_HEADER)
+            write_maya_ascii(project, stream, name, image_path, maya_up_axis)
+        outputs.append(ma_path)
+
+    if 'usda' in formats:
+        usda_path = os.path.join(output_dir, name + '.usda')
+        with open(usda_path, 'w', buffering=WRITE_BUFFER_SIZE) as stream:
+            write_usda(project, stream, name, image_path, maya_up_axis)
+        outputs.append(usda_path)
+
+    return outputs
+
+
+def _convert_job(job):
+    path, output_dir, kwargs = job
+    if output_dir is None:
+        return ConversionResult(path, [], "its outputs would overwrite another project's")
+    try:
+        return ConversionResult(path, convert_file(path, output_dir, **kwargs), '')
+    except Exception as e:
+        return ConversionResult(path, [], '{0}: {1}'.format(type(e).__name__, e))
+
+
+def find_projects(input_dir, recursive=False):
+    pattern = os.path.join(input_dir, '**', '*.fspy') if recursive else os.path.join(input_dir, '*.fspy')
+    return sorted(glob.glob(pattern, recursive=recursive))
+
+
+def convert_directory(input_dir, output_dir, workers=None, recursive=False, **kwargs):
+    """Converts every .fspy file in input_dir on a process pool
+
+    One bad file doesn't stop the batch, its error is in its result.
+    Outputs go to the same subfolders of output_dir as their projects are
+    in under input_dir.
+
+    Parameters:
+    -----------
+    workers : int
+        The number of processes, defaults to the CPU count
+    kwargs
+        Passed along to convert_file()
+
+    Returns:
+    --------
+    list
+        A ConversionResult per project
+    """
+    paths = find_projects(input_dir, recursive)
+    jobs = []
+    for path, name in zip(paths, get_output_names(paths, input_dir)):
+        folder = os.path.join(output_dir, os.path.dirname(name)) if name is not None else None
+        if folder is not None and not os.path.isdir(folder):
+            os.makedirs(folder)
+        jobs.append((path, folder, kwargs))
+    if not jobs:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    #batch the jobs, a pool round trip per tiny file would cost more than the conversion
+    chunk_size = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_convert_job, jobs, chunksize=chunk_size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert fSpy projects to Maya ASCII and USD ASCII cameras')
+    parser.add_argument('input_dir')
+    parser.add_argument('output_dir')
+    parser.add_argument('--format', action='append', choices=FORMATS,
+                        help='may be repeated, defaults to every format')
+    parser.add_argument('--up-axis', choices=['y', 'z'], default='y', help="the Maya scenes' up-axis")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--recursive', action='store_true')
+    parser.add_argument('--no-images', action='store_true', help="don't extract the plates")
+    args = parser.parse_args(argv)
+
+    results = convert_directory(args.input_dir, args.output_dir, workers=args.workers,
+                                recursive=args.recursive, formats=tuple(args.format or FORMATS),
+                                extract_image=not args.no_images, maya_up_axis=args.up_axis)
+    failures = [result for result in results if result.error]
+    for result in failures:
+        print('FAILED {0} {1}'.format(result.path, result.error))
+    print('Converted {0} of {1} projects'.format(len(results) - len(failures), len(results)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,206 @@
+"""Parses projects in worker processes without pickling their images back
+
+Workers send back a small PlateDescriptor. The image itself is either
+mapped straight from the .fspy file at its offset or left in a
+multiprocessing.shared_memory segment, and the calling process attaches
+to it without a copy.
+
+Workers are spawned rather than forked, and run mayapy when this runs in
+Maya's GUI, so the session itself is never copied.
+
+Example:
+    for handle in parallel.load_projects(paths, workers=8):
+        with handle:
+            if handle.error is None:
+                fspy_maya.set_camera(handle.project, camera)
+"""
+import os
+import sys
+import mmap
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory, resource_tracker
+
+from fspy_maya import fspy
+
+
+#the image stays in the .fspy file and is memory mapped
+OFFSETS = 'offsets'
+#workers copy the image into a shared memory segment
+SHARED_MEMORY = 'shared_memory'
+
+PlateDescriptor = collections.namedtuple('PlateDescriptor', ['path', 'header', 'state_data', 'image_offset',
+                                                             'image_size', 'shared_memory_name'])
+
+
+def get_python_executable():
+    """The interpreter to run workers with, mayapy next to Maya when this runs in its GUI"""
+    folder, name = os.path.split(sys.executable)
+    if os.path.splitext(name)[0].lower() != 'maya':
+        return sys.executable
+
+    mayapy = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+    #bin/ on Windows and Linux, Maya.app/Contents/bin on macOS where Maya is in Contents/MacOS
+    for candidate in (os.path.join(folder, mayapy), os.path.join(folder, os.pardir, 'bin', mayapy)):
+        if os.path.isfile(candidate):
+            return os.path.normpath(candidate)
+    return sys.executable
+
+
+def get_context():
+    """A spawn context whose workers run get_python_executable()"""
+    context = multiprocessing.get_context('spawn')
+    context.set_executable(get_python_executable())
+    return context
+
+
+def _create_segment(size):
+    """A POSIX shared memory segment that outlives this process, the caller unlinks it"""
+    try:
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    except TypeError:
+        #before 3.13 every segment is tracked and would be unlinked when this process exits
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        if os.name == 'posix':
+            #the tracker knows POSIX segments by their name with a leading /
+            resource_tracker.unregister('/' + segment.name.lstrip('/'), 'shared_memory')
+        return segment
+
+
+def _parse(path, transfer):
+    with open(path, 'rb') as project_file:
+        header = project_file.read(fspy.HEADER_SIZE)
+        state_string_size, image_buffer_size = fspy.parse_header(header, os.fstat(project_file.fileno()).st_size)
+        state_data = project_file.read(state_string_size)
+        #parsing here means a broken state fails in the worker, not the caller
+        fspy.Project(header + state_data, load_image=False)
+
+        image_offset = fspy.HEADER_SIZE + state_string_size
+        if transfer != SHARED_MEMORY:
+            return PlateDescriptor(path, header, state_data, image_offset, image_buffer_size, None)
+
+        segment = _create_segment(image_buffer_size)
+        try:
+            project_file.readinto(segment.buf[:image_buffer_size])
+        except:
+            segment.close()
+            segment.unlink()
+            raise
+        segment.close()
+        return PlateDescriptor(path, header, state_data, image_offset, image_buffer_size, segment.name)
+
+
+class ProjectHandle:
+    """A project whose image_data is a zero-copy view owned by this handle
+
+    release() (or leaving a with block) frees the mapping or shared memory
+    segment. project.image_data can't be used after that. A project that
+    couldn't be loaded has an error and no project.
+    """
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+        self.path = descriptor.path
+        self.error = None
+        self._segment = None
+        self._map = None
+        self._view = None
+
+        project = fspy.Project(descriptor.header + descriptor.state_data, load_image=False)
+        if descriptor.shared_memory_name:
+            self._segment = shared_memory.SharedMemory(name=descriptor.shared_memory_name)
+            self._view = self._segment.buf[:descriptor.image_size]
+        else:
+            with open(descriptor.path, 'rb') as project_file:
+                self._map = mmap.mmap(project_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)[descriptor.image_offset:descriptor.image_offset + descriptor.image_size]
+
+        project.image_data = self._view
+        project.source_path = os.path.abspath(descriptor.path)
+        project.file_name = os.path.basename(descriptor.path)
+        self.project = project
+
+    @classmethod
+    def from_error(cls, path, error):
+        handle = cls.__new__(cls)
+        handle.descriptor = None
+        handle.path = path
+        handle.error = error
+        handle.project = None
+        return handle
+
+    def release(self):
+        if self.project is None:
+            return
+        self.project.image_data = None
+        self.project = None
+        self._view.release()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+def release_descriptor(descriptor):
+    """Frees the shared memory of a descriptor that never became a ProjectHandle"""
+    if descriptor.shared_memory_name:
+        segment = shared_memory.SharedMemory(name=descriptor.shared_memory_name)
+        segment.close()
+        segment.unlink()
+
+
+def load_projects(paths, workers=None, transfer=OFFSETS):
+    """Parses projects on a process pool and yields a ProjectHandle per project as each finishes
+
+    Parameters:
+    -----------
+    transfer : str
+        OFFSETS maps images from their files, SHARED_MEMORY copies them
+        into shared memory, e.g. when the files may change or go away.
+        Windows always uses OFFSETS.
+
+    A project that fails to load is yielded with its error, the rest still
+    load. The caller releases each handle. Stopping early releases the
+    results that finished but weren't yielded yet.
+    """
+    if sys.platform == 'win32':
+        #a Windows mapping is destroyed with its last handle, which is the
+        #worker's, so a segment is gone before the caller can attach to it
+        transfer = OFFSETS
+        
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context()) as executor:
+        futures = dict((executor.submit(_parse, path, transfer), path) for path in paths)
+        yielded = set()
+        try:
+            for future in as_completed(futures):
+                yielded.add(future)
+                try:
+                    descriptor = future.result()
+                except Exception as e:
+                    yield ProjectHandle.from_error(futures[future], e)
+                    continue
+
+                try:
+                    handle = ProjectHandle(descriptor)
+                except Exception as e:
+                    release_descriptor(descriptor)
+                    handle = ProjectHandle.from_error(descriptor.path, e)
+                yield handle
+        finally:
+            for future in futures:
+                future.cancel()
+            for future in futures:
+                if future in yielded or future.cancelled():
+                    continue
+                try:
+                    descriptor = future.result()
+                except Exception:
+                    continue
+                release_descriptor(descriptor)
@@ -0,0 +1,218 @@
+"""A content-addressed plate cache that many workstations can share"""
+import os
+import time
+import uuid
+import socket
+import hashlib
+
+
+#the FSPY_PLATE_CACHE environment variable turns the shared cache on for imports
+ENVIRONMENT_VARIABLE = 'FSPY_PLATE_CACHE'
+
+#plates are written in chunks so the lock can be kept fresh in between
+WRITE_CHUNK_BYTES = 8 * 1024 * 1024
+
+#(leading bytes, extension) of the image types fSpy plates come in, the names imghdr gave them
+IMAGE_SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'\x76\x2f\x31\x01', 'exr'),
+    (b'II*\x00', 'tiff'),
+    (b'MM\x00*', 'tiff'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+    (b'BM', 'bmp'),
+]
+
+
+def get_image_extension(image_data):
+    """Returns the image type of the bytes, e.g. 'png', or '' if it's unknown"""
+    header = bytes(image_data[:8])
+    for signature, extension in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return extension
+    return ''
+
+
+class SharedPlateCache:
+    """Stores plates under root/<first 2 hash characters>/<hash>.<extension>
+
+    Parameters:
+    -----------
+    root : str
+        The cache folder, usually on a file server
+    stale_lock_seconds : float
+        A lockfile older than this belongs to a crashed writer and is broken
+    """
+    def __init__(self, root, stale_lock_seconds=300.0, poll_seconds=0.05):
+        self.root = root
+        self.stale_lock_seconds = stale_lock_seconds
+        self.poll_seconds = poll_seconds
+
+    @classmethod
+    def from_environment(cls):
+        """Returns the cache set by FSPY_PLATE_CACHE or None"""
+        root = os.getenv(ENVIRONMENT_VARIABLE)
+        return cls(root) if root else None
+
+    def get_path(self, content_hash, extension=''):
+        file_name = '{0}.{1}'.format(content_hash, extension) if extension else content_hash
+        return os.path.join(self.root, content_hash[:2], file_name)
+
+    def store(self, image_data):
+        """Returns the cached path of the image, writing it if no one has yet
+
+        Many processes can call this for the same plate at once; exactly one
+        writes it and the rest wait for the rename.
+        """
+        path = self.get_path(hashlib.sha256(image_data).hexdigest(), get_image_extension(image_data))
+        folder = os.path.dirname(path)
+        if not os.path.isdir(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        lock_path = path + '.lock'
+        #the lock holds this token, so a holder whose lock was broken can't remove the new one
+        token = '{0}:{1}:{2}'.format(socket.gethostname(), os.getpid(), uuid.uuid4().hex)
+        while True:
+            if os.path.exists(path):
+                self._touch(path)
+                return path
+
+            try:
+                lock = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._break_stale_lock(lock_path)
+                time.sleep(self.poll_seconds)
+                continue
+
+            try:
+                os.write(lock, token.encode())
+                os.close(lock)
+                #someone may have finished between our exists() check and taking the lock
+                if not os.path.exists(path):
+                    self._write(path, image_data, lock_path)
+                return path
+            finally:
+                self._release_lock(lock_path, token)
+
+    def _write(self, path, image_data, lock_path):
+        temp_path = '{0}.{1}.{2}.tmp'.format(path, socket.gethostname(), os.getpid())
+        view = memoryview(image_data)
+        refreshed = time.time()
+        try:
+            with open(temp_path, 'wb') as temp_file:
+                for start in range(0, len(view), WRITE_CHUNK_BYTES):
+                    temp_file.write(view[start:start + WRITE_CHUNK_BYTES])
+                    #a slow file server must not make the lock look like a crashed writer's
+                    if time.time() - refreshed > self.stale_lock_seconds / 4.0:
+                        self._touch(lock_path)
+                        refreshed = time.time()
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+        except:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            view.release()
+
+    @staticmethod
+    def _read_lock(lock_path):
+        try:
+            with open(lock_path, 'rb') as lock_file:
+                return lock_file.read().decode('utf-8', 'replace')
+        except OSError:
+            return None
+
+    def _release_lock(self, lock_path, token):
+        if self._read_lock(lock_path) != token:
+            #our lock was broken as stale and someone else holds it now
+            return
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+    def _break_stale_lock(self, lock_path):
+        try:
+            if time.time() - os.path.getmtime(lock_path) <= self.stale_lock_seconds:
+                return
+        except OSError:
+            #the writer finished
+            return
+
+        stale_token = self._read_lock(lock_path)
+        #move it out of the way first, so two processes breaking the same lock
+        #can't remove a fresh one taken in between
+        broken_path = '{0}.{1}.broken'.format(lock_path, uuid.uuid4().hex)
+        try:
+            os.rename(lock_path, broken_path)
+        except OSError:
+            #another process broke the lock first
+            return
+
+        if self._read_lock(broken_path) != stale_token:
+            #we moved a fresh lock, so put it back unless it's been taken again since
+            try:
+                os.link(broken_path, lock_path)
+            except OSError:
+                pass
+        try:
+            os.remove(broken_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _touch(path):
+        #eviction goes by mtime, since file servers are often mounted with noatime
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def entries(self):
+        """Returns (mtime, size, path) for every finished plate, oldest first"""
+        results = []
+        for folder, dirs, files in os.walk(self.root):
+            for file_name in files:
+                if file_name.endswith(('.lock', '.tmp', '.broken')):
+                    continue
+                path = os.path.join(folder, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                results.append((stat.st_mtime, stat.st_size, path))
+        results.sort()
+        return results
+
+    def evict(self, max_bytes, keep=()):
+        """Removes the least recently used plates until the cache fits in max_bytes
+
+        Parameters:
+        -----------
+        keep : list
+            Paths that must not be removed, e.g. plates referenced by open scenes
+
+        Returns:
+        --------
+        list
+            The removed paths
+        """
+        entries = self.entries()
+        total = sum(size for mtime, size, path in entries)
+        keep = set(os.path.abspath(path) for path in keep)
+        removed = []
+        for mtime, size, path in entries:
+            if total <= max_bytes:
+                break
+            if os.path.abspath(path) in keep or os.path.exists(path + '.lock'):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed.append(path)
+        return removed
@@ -0,0 +1,210 @@
+"""Writes camera plates, right away or the first time a panel looks through the camera"""
+import os
+import mmap
+import hashlib
+import threading
+
+import pymel.core as pm
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaUI as omui
+import maya.utils
+
+from fspy_maya import fspy
+from fspy_maya import scene_index
+from fspy_maya.plate_cache import SharedPlateCache, get_image_extension
+
+
+#the name set_camera() has always given workspace plates
+DEFAULT_PLATE_NAME = 'fspy-temp-image'
+
+#panel camera change callbacks, installed while deferred plates are waiting
+_CALLBACK_IDS = []
+#camera shapes with an extraction running
+_EXTRACTING = set()
+
+
+def get_plate_folder():
+    return os.path.join(pm.system.workspace.getPath(), 'sourceimages')
+
+
+def save_plate(image_data, folder, file_name=DEFAULT_PLATE_NAME, plate_cache=None):
+    """Writes the image to plate_cache or folder/file_name.<extension>, returning its path
+
+    This doesn't touch the scene, so it's safe off the main thread.
+    """
+    if plate_cache is not None:
+        return plate_cache.store(image_data)
+
+    extension = get_image_extension(image_data)
+    image_path = os.path.join(folder, '{0}.{1}'.format(file_name, extension) if extension else file_name)
+    with open(image_path, 'wb') as image_file:
+        image_file.write(image_data)
+    return image_path
+
+
+def _get_image_plane_shape(camera_shape):
+    image_plane = pm.general.listConnections(camera_shape, type="imagePlane")
+    if image_plane:
+        return image_plane[0].getShape()
+    return None
+
+
+def is_plate_pending(camera : pm.nodetypes.Transform):
+    """True when the camera's image plane is a placeholder for a plate still in its .fspy"""
+    camera_shape = camera.getShape()
+    if not camera_shape.hasAttr(scene_index.IMAGE_SIZE_ATTR) or not camera_shape.attr(scene_index.IMAGE_SIZE_ATTR).get():
+        return False
+    image_plane_shape = _get_image_plane_shape(camera_shape)
+    return image_plane_shape is not None and not image_plane_shape.imageName.get()
+
+
+def get_pending_cameras():
+    return [camera for camera in scene_index.list_cameras() if is_plate_pending(camera)]
+
+
+def _copy_plate(source_path, image_offset, image_size, folder, file_name, plate_cache):
+    """Returns the plate's path, the source's content hash and its (size, mtime) stamp
+
+    Runs on a worker thread. The hash is the one tag_camera() skipped, the
+    file is mapped anyway so it costs no extra reads.
+    """
+    #check the .fspy still has its image where it did at import
+    state_string_size, image_buffer_size = fspy.read_header(source_path)
+    if (fspy.HEADER_SIZE + state_string_size, image_buffer_size) != (image_offset, image_size):
+        raise fspy.ParsingError("{0} has changed since it was imported".format(source_path))
+
+    with open(source_path, 'rb') as project_file:
+        stat = os.fstat(project_file.fileno())
+        project_map = mmap.mmap(project_file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        view = memoryview(project_map)[image_offset:image_offset + image_size]
+        try:
+            image_path = save_plate(view, folder, file_name, plate_cache)
+        finally:
+            view.release()
+        content_hash = hashlib.sha256(project_map).hexdigest()
+    finally:
+        project_map.close()
+    return image_path, content_hash, (float(stat.st_size), stat.st_mtime)
+
+
+def _record_hash(camera_shape, content_hash, stamp):
+    #only if the file extracted from is still the one tag_camera() stamped
+    recorded = (camera_shape.attr(scene_index.FILE_SIZE_ATTR).get(),
+                camera_shape.attr(scene_index.FILE_MTIME_ATTR).get())
+    if stamp == recorded and not camera_shape.attr(scene_index.HASH_ATTR).get():
+        camera_shape.attr(scene_index.HASH_ATTR).set(content_hash)
+
+
+def _finish_extraction(camera_shape_name, result, error):
+    _EXTRACTING.discard(camera_shape_name)
+    if error is not None:
+        pm.warning("Couldn't extract the fSpy plate of {0}: {1}".format(camera_shape_name, error))
+        return
+
+    image_path, content_hash, stamp = result
+    if pm.objExists(camera_shape_name):
+        camera_shape = pm.PyNode(camera_shape_name)
+        _record_hash(camera_shape, content_hash, stamp)
+        image_plane_shape = _get_image_plane_shape(camera_shape)
+        if image_plane_shape is not None and not image_plane_shape.imageName.get():
+            image_plane_shape.imageName.set(image_path, type='string')
+
+    if not get_pending_cameras():
+        stop_watching()
+
+
+def extract_plate(camera : pm.nodetypes.Transform, wait=False, plate_cache=None):
+    """Writes a deferred plate and points the camera's image plane at it
+
+    Parameters:
+    -----------
+    wait : bool
+        Extract on this thread and return the path, instead of in the background
+
+    Returns:
+    --------
+    str
+        The plate's path when wait is True, otherwise None
+    """
+    camera_shape = camera.getShape()
+    camera_shape_name = camera_shape.longName()
+    if not is_plate_pending(camera) or camera_shape_name in _EXTRACTING:
+        return None
+
+    if plate_cache is None:
+        plate_cache = SharedPlateCache.from_environment()
+    source_path = camera_shape.attr(scene_index.PATH_ATTR).get()
+    args = (source_path,
+            int(camera_shape.attr(scene_index.IMAGE_OFFSET_ATTR).get()),
+            int(camera_shape.attr(scene_index.IMAGE_SIZE_ATTR).get()),
+            get_plate_folder(),
+            os.path.splitext(os.path.basename(source_path))[0],
+            plate_cache)
+
+    _EXTRACTING.add(camera_shape_name)
+    if wait:
+        try:
+            result = _copy_plate(*args)
+        except:
+            _EXTRACTING.discard(camera_shape_name)
+            raise
+        _finish_extraction(camera_shape_name, result, None)
+        return result[0]
+
+    def worker():
+        result, error = None, None
+        try:
+            result = _copy_plate(*args)
+        except Exception as e:
+            error = e
+        #scene edits have to happen on the main thread
+        maya.utils.executeDeferred(_finish_extraction, camera_shape_name, result, error)
+
+    threading.Thread(target=worker, name='fspy plate ' + camera_shape_name, daemon=True).start()
+    return None
+
+
+def _on_camera_changed(panel, camera_object, *args):
+    dag_path = om.MDagPath.getAPathTo(camera_object)
+    if dag_path.apiType() == om.MFn.kCamera:
+        dag_path.pop()
+    camera = pm.PyNode(dag_path.fullPathName())
+    if is_plate_pending(camera):
+        extract_plate(camera)
+
+
+def watch_panels():
+    """Extracts deferred plates as model panels look through their cameras
+
+    Panels made after this is called aren't watched until it's called again.
+    """
+    stop_watching()
+    if om.MGlobal.mayaState() != om.MGlobal.kInteractive:
+        #batch sessions have no panels, plates there are extracted with extract_plate()
+        return
+    for panel in pm.getPanel(type='modelPanel') or []:
+        _CALLBACK_IDS.append(omui.MUiMessage.addCameraChangedCallback(panel, _on_camera_changed))
+
+        #a panel may already be looking through a camera that was just imported
+        camera = pm.modelPanel(panel, query=True, camera=True)
+        if camera:
+            camera = pm.PyNode(camera)
+            if camera.type() == 'camera':
+                camera = camera.getParent()
+            if camera.getShape().type() == 'camera' and is_plate_pending(camera):
+                extract_plate(camera)
+
+
+def watch_pending(*args):
+    """watch_panels() when the scene has deferred plates, for scene open and import callbacks"""
+    if get_pending_cameras():
+        watch_panels()
+    else:
+        stop_watching()
+
+
+def stop_watching():
+    for callback_id in _CALLBACK_IDS:
+        om.MMessage.removeCallback(callback_id)
+    del _CALLBACK_IDS[:]
@@ -0,0 +1,220 @@
+"""Builds a saved Maya scene per .fspy project on a pool of mayapy workers
+
+Each worker process starts Maya once and reuses it for every job it
+gets, so the startup cost is paid per worker rather than per shot. The
+work a worker does is pluggable, DryRunWorker stands in for Maya where
+it isn't installed.
+
+example: mayapy -m fspy_maya.scene_builder shots/ scenes/ --workers 4 --guide
+"""
+import os
+import sys
+import time
+import argparse
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import util
+
+from fspy_maya import fspy
+from fspy_maya import conversion
+from fspy_maya.headless import get_node_name, get_output_names, find_projects
+
+
+SCENE_EXTENSION = '.mb'
+
+#startup_seconds is the time making the worker took, charged to the first job it ran
+BuildResult = collections.namedtuple('BuildResult', ['path', 'scene_path', 'seconds', 'error',
+                                                     'worker', 'startup_seconds'])
+
+#this process' worker, made by the first job that lands here
+_WORKER = None
+
+
+class MayaWorker:
+    """Builds scenes in a maya.standalone session
+
+    Parameters:
+    -----------
+    plate_root : str
+        Where plates are written, as a plate_cache.SharedPlateCache.
+        Defaults to FSPY_PLATE_CACHE, then the workspace sourceimages.
+    """
+    def __init__(self, plate_root=None):
+        #importing pymel starts maya.standalone, if the process hasn't already
+        import pymel.core as pm
+        from fspy_maya import core
+        from fspy_maya.plate_cache import SharedPlateCache
+
+        self._pm = pm
+        self._core = core
+        self.plate_cache = SharedPlateCache(plate_root) if plate_root else SharedPlateCache.from_environment()
+
+    def build(self, path, scene_path, maya_up_axis='y', guide=False, vanishing_lines=False):
+        pm = self._pm
+        core = self._core
+        pm.newFile(force=True)
+        pm.upAxis(axis=maya_up_axis)
+        project = fspy.Project(path)
+
+        with core.import_transaction(undoable=False):
+            name = get_node_name(path)
+            camera = pm.createNode('camera', n=name + 'Shape').getParent()
+            camera.rename(name)
+            core.set_camera(project, camera, plate_cache=self.plate_cache)
+            if guide:
+                core.create_guide(project)
+            if vanishing_lines:
+                core.create_vanishing_lines(project, camera)
+
+        pm.saveAs(scene_path, type='mayaBinary', force=True)
+        return scene_path
+
+    def close(self):
+        import maya.standalone
+        maya.standalone.uninitialize()
+
+
+class DryRunWorker:
+    """Reads each project and solves its camera, without Maya and without saving
+
+    Stands in for MayaWorker to check a batch, or the pool, where Maya isn't installed.
+    """
+    def __init__(self, plate_root=None):
+        self.plate_root = plate_root
+
+    def build(self, path, scene_path, maya_up_axis='y', guide=False, vanishing_lines=False):
+        project = fspy.Project(path, load_image=False)
+        conversion.get_camera_values(project, maya_up_axis=maya_up_axis)
+        return scene_path
+
+    def close(self):
+        pass
+
+
+def _get_worker(worker_factory, plate_root):
+    global _WORKER
+    if _WORKER is not None:
+        return _WORKER, 0.0
+
+    start = time.perf_counter()
+    worker = worker_factory(plate_root)
+    #atexit doesn't run in pool processes, multiprocessing's finalizers do
+    util.Finalize(worker, worker.close, exitpriority=10)
+    _WORKER = worker
+    return worker, time.perf_counter() - start
+
+
+def _build_job(path, scene_path, worker_factory, plate_root, options):
+    startup_seconds = 0.0
+    start = time.perf_counter()
+    try:
+        worker, startup_seconds = _get_worker(worker_factory, plate_root)
+        start = time.perf_counter()
+        worker.build(path, scene_path, **options)
+    except Exception as e:
+        return BuildResult(path, '', time.perf_counter() - start, '{0}: {1}'.format(type(e).__name__, e),
+                           os.getpid(), startup_seconds)
+    return BuildResult(path, scene_path, time.perf_counter() - start, '', os.getpid(), startup_seconds)
+
+
+def build_scenes(paths, output_dir, workers=None, worker_factory=MayaWorker, plate_root=None,
+                 input_dir=None, **options):
+    """Builds a scene per project on a process pool and yields a BuildResult per project as each finishes
+
+    One bad project doesn't stop the batch, its error is in its result.
+    A worker that crashes Maya breaks the pool, every job still waiting
+    then fails with BrokenProcessPool. A project whose scene would
+    overwrite another's fails without being built.
+
+    Parameters:
+    -----------
+    workers : int
+        The number of Maya sessions, defaults to the CPU count
+    worker_factory : callable
+        Makes a process' worker from plate_root, e.g. MayaWorker or
+        DryRunWorker. It has to be picklable, so a module level class or function.
+    plate_root : str
+        The plate folder, defaults to output_dir/sourceimages
+    input_dir : str
+        Scenes go in the same subfolders of output_dir as their projects
+        are in under input_dir, which defaults to the folder all the projects share
+    options
+        Passed along to the worker's build(): maya_up_axis, guide, vanishing_lines
+    """
+    paths = list(paths)
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    if plate_root is None:
+        plate_root = os.path.join(output_dir, 'sourceimages')
+    if input_dir is None and paths:
+        input_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    names = get_output_names([os.path.abspath(path) for path in paths], os.path.abspath(input_dir or '.'))
+
+    workers = workers or os.cpu_count() or 1
+    #under mayapy this process may have Maya running already, which mustn't be forked
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {}
+        clashes = []
+        for path, name in zip(paths, names):
+            if name is None:
+                clashes.append(BuildResult(path, '', 0.0, "its scene would overwrite another project's", 0, 0.0))
+                continue
+            scene_path = os.path.join(output_dir, name + SCENE_EXTENSION)
+            if not os.path.isdir(os.path.dirname(scene_path)):
+                os.makedirs(os.path.dirname(scene_path))
+            future = executor.submit(_build_job, path, scene_path, worker_factory, plate_root, options)
+            futures[future] = path
+
+        try:
+            for result in clashes:
+                yield result
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except BrokenProcessPool as e:
+                    yield BuildResult(futures[future], '', 0.0, 'BrokenProcessPool: {0}'.format(e), 0, 0.0)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build a Maya scene per fSpy project with mayapy')
+    parser.add_argument('input_dir')
+    parser.add_argument('output_dir')
+    parser.add_argument('--up-axis', choices=['y', 'z'], default='y', help="the scenes' up-axis")
+    parser.add_argument('--workers', type=int, default=None, help='Maya sessions, each holds a license')
+    parser.add_argument('--recursive', action='store_true')
+    parser.add_argument('--guide', action='store_true')
+    parser.add_argument('--vanishing-lines', action='store_true')
+    parser.add_argument('--plate-root', default=None, help='defaults to <output_dir>/sourceimages')
+    parser.add_argument('--dry-run', action='store_true', help="solve the cameras without Maya or saving")
+    args = parser.parse_args(argv)
+
+    paths = find_projects(args.input_dir, args.recursive)
+    start = time.perf_counter()
+    failures = 0
+    shot_seconds = 0.0
+    startup_seconds = 0.0
+    for result in build_scenes(paths, args.output_dir, workers=args.workers,
+                               worker_factory=DryRunWorker if args.dry_run else MayaWorker,
+                               plate_root=args.plate_root, input_dir=args.input_dir, maya_up_axis=args.up_axis,
+                               guide=args.guide, vanishing_lines=args.vanishing_lines):
+        shot_seconds += result.seconds
+        startup_seconds += result.startup_seconds
+        if result.error:
+            failures += 1
+            print('FAILED {0} {1}'.format(result.path, result.error))
+        else:
+            print('{0:.3f}s {1} -> {2}'.format(result.seconds, result.path, result.scene_path))
+
+    print('Built {0} of {1} scenes in {2:.1f}s, {3:.1f}s building and {4:.1f}s starting workers'.format(
+        len(paths) - failures, len(paths), time.perf_counter() - start, shot_seconds, startup_seconds))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import os
+import time
+
+import pymel.core as pm
+
+from fspy_maya import fspy
+
+
+INDEX_NODE_NAME = 'fspy_index'
+INDEX_ATTR = 'fspyCameras'
+
+#the source metadata every imported camera shape gets
+PATH_ATTR = 'fspyPath'
+HASH_ATTR = 'fspyHash'
+UNIT_ATTR = 'fspyUnit'
+UP_AXIS_ATTR = 'fspyUpAxis'
+IMPORT_TIME_ATTR = 'fspyImportTime'
+FILE_SIZE_ATTR = 'fspyFileSize'
+FILE_MTIME_ATTR = 'fspyFileMtime'
+#where the plate is inside the source .fspy, so it can be extracted later
+IMAGE_OFFSET_ATTR = 'fspyImageOffset'
+IMAGE_SIZE_ATTR = 'fspyImageSize'
+
+STRING_ATTRS = [PATH_ATTR, HASH_ATTR, UNIT_ATTR, UP_AXIS_ATTR, IMPORT_TIME_ATTR]
+DOUBLE_ATTRS = [FILE_SIZE_ATTR, FILE_MTIME_ATTR, IMAGE_OFFSET_ATTR, IMAGE_SIZE_ATTR]
+
+
+class CameraStatus:
+    """The state of an indexed camera's source project and plate
+
+    A pending plate is a deferred one still waiting in its .fspy, which
+    isn't missing.
+    """
+    def __init__(self, camera, source_path, plate_path, missing_source, stale, missing_plate, pending_plate=False):
+        self.camera = camera
+        self.source_path = source_path
+        self.plate_path = plate_path
+        self.missing_source = missing_source
+        self.stale = stale
+        self.missing_plate = missing_plate
+        self.pending_plate = pending_plate
+
+    @property
+    def ok(self):
+        return not (self.missing_source or self.stale or self.missing_plate)
+
+
+def get_index_node(create=True):
+    """Returns the scene's fSpy index node, a network node listing every fSpy camera
+
+    Returns:
+    --------
+    pm.nodetypes.Network
+        The index or None if there's none and create is False
+    """
+    nodes = pm.ls(INDEX_NODE_NAME, type='network')
+    if nodes:
+        return nodes[0]
+
+    if not create:
+        return None
+
+    index_node = pm.createNode('network', name=INDEX_NODE_NAME)
+    index_node.addAttr(INDEX_ATTR, attributeType='message', multi=True, indexMatters=False)
+    return index_node
+
+
+def _get_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (float(stat.st_size), stat.st_mtime)
+
+
+def tag_camera(camera : pm.nodetypes.Transform, project):
+    """Records the project's source on the camera and adds the camera to the index"""
+    camera_shape = camera.getShape()
+    for attr in STRING_ATTRS:
+        if not camera_shape.hasAttr(attr):
+            camera_shape.addAttr(attr, dataType='string')
+    for attr in DOUBLE_ATTRS:
+        if not camera_shape.hasAttr(attr):
+            camera_shape.addAttr(attr, attributeType='double')
+
+    source_path = project.source_path or ''
+    camera_shape.attr(PATH_ATTR).set(source_path)
+    #hashing a deferred project would read its plate, extract_plate() records it instead
+    camera_shape.attr(HASH_ATTR).set(project.content_hash if project.image_data is not None else '')
+    camera_shape.attr(UNIT_ATTR).set(project.reference_distance_unit)
+    camera_shape.attr(UP_AXIS_ATTR).set('z' if project.z_up else 'y')
+    camera_shape.attr(IMPORT_TIME_ATTR).set(time.strftime('%Y-%m-%dT%H:%M:%S'))
+
+    camera_shape.attr(IMAGE_OFFSET_ATTR).set(project.image_offset)
+    camera_shape.attr(IMAGE_SIZE_ATTR).set(project.image_size)
+
+    stamp = _get_stamp(source_path) if source_path else None
+    if stamp:
+        camera_shape.attr(FILE_SIZE_ATTR).set(stamp[0])
+        camera_shape.attr(FILE_MTIME_ATTR).set(stamp[1])
+
+    index_attr = get_index_node().attr(INDEX_ATTR)
+    if camera_shape not in index_attr.inputs():
+        pm.connectAttr(camera_shape.message, index_attr, nextAvailable=True)
+
+
+def list_cameras():
+    """Returns the transforms of every fSpy camera in the scene
+
+    This reads the index node's connections, it doesn't search the scene.
+    """
+    index_node = get_index_node(create=False)
+    if index_node is None:
+        return []
+
+    return [shape.getParent() for shape in index_node.attr(INDEX_ATTR).inputs()]
+
+
+def _get_image_plane_shape(camera_shape):
+    image_plane = pm.general.listConnections(camera_shape, type="imagePlane")
+    if image_plane:
+        return image_plane[0].getShape()
+    return None
+
+
+def check_cameras(cameras=None):
+    """Checks each fSpy camera for a missing or changed source and a missing plate
+
+    A source is only re-hashed when its size or modification time differs
+    from what was recorded at import. Deferred imports have no hash until
+    their plate is extracted, so until then any change counts as stale.
+
+    Returns:
+    --------
+    list
+        A CameraStatus per camera
+    """
+    results = []
+    for camera in cameras if cameras is not None else list_cameras():
+        camera_shape = camera.getShape()
+        source_path = camera_shape.attr(PATH_ATTR).get() or ''
+        stamp = _get_stamp(source_path) if source_path else None
+
+        stale = False
+        recorded = (camera_shape.attr(FILE_SIZE_ATTR).get(), camera_shape.attr(FILE_MTIME_ATTR).get())
+        if stamp and stamp != recorded:
+            #without a hash, from a deferred import, a changed stamp is all there is to go on
+            recorded_hash = camera_shape.attr(HASH_ATTR).get()
+            stale = not recorded_hash or fspy.file_hash(source_path) != recorded_hash
+
+        plate_path = ''
+        image_plane_shape = _get_image_plane_shape(camera_shape)
+        if image_plane_shape:
+            plate_path = image_plane_shape.imageName.get() or ''
+        #a deferred import's empty image plane, see plate_loader.is_plate_pending()
+        pending_plate = bool(image_plane_shape and not plate_path and camera_shape.attr(IMAGE_SIZE_ATTR).get())
+
+        results.append(CameraStatus(camera, source_path, plate_path,
+                                    missing_source=stamp is None, stale=stale,
+                                    missing_plate=not pending_plate and not os.path.isfile(plate_path),
+                                    pending_plate=pending_plate))
+    return results
+
+
+def _find_file(file_name, search_dirs, cache):
+    if file_name not in cache:
+        cache[file_name] = None
+        for search_dir in search_dirs:
+            candidate = os.path.join(search_dir, file_name)
+            if os.path.isfile(candidate):
+                cache[file_name] = candidate
+                break
+    return cache[file_name]
+
+
+def _is_same_source(camera_shape, path):
+    #a same-named file may be a different solve
+    recorded_hash = camera_shape.attr(HASH_ATTR).get()
+    if recorded_hash:
+        return fspy.file_hash(path) == recorded_hash
+
+    #deferred imports have no hash, but their plate has to be where it was recorded
+    try:
+        state_string_size, image_buffer_size = fspy.read_header(path)
+    except (OSError, fspy.ParsingError):
+        return False
+    return ((fspy.HEADER_SIZE + state_string_size, image_buffer_size) ==
+            (camera_shape.attr(IMAGE_OFFSET_ATTR).get(), camera_shape.attr(IMAGE_SIZE_ATTR).get()))
+
+
+def relink(search_dirs, cameras=None):
+    """Points fSpy cameras with missing sources or plates at same-named files in search_dirs
+
+    A source is only relinked to a file matching its recorded hash, or for
+    deferred imports its recorded plate offset and size. Other files are
+    skipped with a warning.
+
+    Returns:
+    --------
+    list
+        The CameraStatus of each camera that was relinked, from before the relink
+    """
+    found = {}
+    relinked = []
+    for status in check_cameras(cameras):
+        if not (status.missing_source or status.missing_plate):
+            continue
+
+        camera_shape = status.camera.getShape()
+        changed = False
+        if status.missing_source and status.source_path:
+            new_path = _find_file(os.path.basename(status.source_path), search_dirs, found)
+            if new_path and not _is_same_source(camera_shape, new_path):
+                pm.warning("{0} doesn't match the project {1} was imported from, it wasn't relinked".format(
+                    new_path, status.camera))
+            elif new_path:
+                camera_shape.attr(PATH_ATTR).set(new_path)
+                stamp = _get_stamp(new_path)
+                camera_shape.attr(FILE_SIZE_ATTR).set(stamp[0])
+                camera_shape.attr(FILE_MTIME_ATTR).set(stamp[1])
+                changed = True
+
+        if status.missing_plate and status.plate_path:
+            new_path = _find_file(os.path.basename(status.plate_path), search_dirs, found)
+            if new_path:
+                _get_image_plane_shape(camera_shape).imageName.set(new_path, type='string')
+                changed = True
+
+        if changed:
+            relinked.append(status)
+
+    return relinked
@@ -0,0 +1,148 @@
+"""Runs jobs over many .fspy files without going over a memory budget"""
+import bisect
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from fspy_maya import fspy
+
+
+#a finished job, error being the exception it raised or None
+JobResult = collections.namedtuple('JobResult', ['path', 'result', 'error', 'cost'])
+
+
+class MemoryBudgetScheduler:
+    """Admits jobs only while the bytes they hold fit in budget_bytes
+    
+    A job's cost is its file's state and image size, read from the header
+    before the job is queued, times cost_factor (e.g. 3 when a job decodes
+    the image). Queued jobs are admitted alternately from the small and
+    large ends so big plates don't all land at once. A job bigger than the
+    whole budget runs alone rather than never. A finished job's cost stays
+    charged until the caller asks for the next result, since the caller is
+    holding its result until then.
+    
+    Example:
+        scheduler = MemoryBudgetScheduler(8 * 1024 ** 3, workers=16)
+        for job in scheduler.run(paths, extract_plate):
+            ...
+    
+    Parameters:
+    -----------
+    executor : concurrent.futures.Executor
+        Runs the jobs, defaults to a thread pool of workers threads
+    """
+    def __init__(self, budget_bytes, workers=4, cost_factor=1.0, executor=None):
+        self.budget_bytes = budget_bytes
+        self.workers = workers
+        self.cost_factor = cost_factor
+        self._executor = executor
+        self._lock = threading.Lock()
+        #(cost, order, path) sorted by cost
+        self._queue = []
+        #running and finished but not yet released jobs, both still charged
+        self._in_flight = {}
+        self._in_flight_bytes = 0
+        self.peak_in_flight_bytes = 0
+        self._take_large = False
+
+    @property
+    def queue_depth(self):
+        with self._lock:
+            return len(self._queue)
+
+    @property
+    def in_flight_jobs(self):
+        with self._lock:
+            return len(self._in_flight)
+
+    @property
+    def in_flight_bytes(self):
+        with self._lock:
+            return self._in_flight_bytes
+
+    def get_cost(self, path):
+        state_string_size, image_buffer_size = fspy.read_header(path)
+        return int((fspy.HEADER_SIZE + state_string_size + image_buffer_size) * self.cost_factor)
+
+    def _pop_next(self):
+        #the caller holds the lock
+        available = self.budget_bytes - self._in_flight_bytes
+        ends = (-1, 0) if self._take_large else (0, -1)
+        for idx in ends:
+            cost = self._queue[idx][0]
+            if cost <= available or not self._in_flight:
+                self._take_large = not self._take_large
+                return self._queue.pop(idx)
+
+        #neither end fits, take the biggest job that does
+        idx = bisect.bisect_right(self._queue, (available, float('inf'))) - 1
+        if idx >= 0:
+            return self._queue.pop(idx)
+        return None
+
+    def _admit(self, executor, job):
+        with self._lock:
+            running = sum(1 for future in self._in_flight if not future.done())
+            while self._queue and running < self.workers:
+                entry = self._pop_next()
+                if entry is None:
+                    break
+                cost, order, path = entry
+                self._in_flight_bytes += cost
+                self.peak_in_flight_bytes = max(self.peak_in_flight_bytes, self._in_flight_bytes)
+                self._in_flight[executor.submit(job, path)] = (path, cost)
+                running += 1
+
+    def _drain(self, executor, job, block):
+        """Yields the finished jobs, releasing each one's cost once the caller is done with it"""
+        with self._lock:
+            futures = list(self._in_flight)
+        if not futures:
+            return
+
+        done, pending = wait(futures, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        #finished jobs free their workers even though their bytes are still held
+        self._admit(executor, job)
+        for future in done:
+            with self._lock:
+                path, cost = self._in_flight[future]
+            error = future.exception()
+            try:
+                yield JobResult(path, None if error else future.result(), error, cost)
+            finally:
+                with self._lock:
+                    del self._in_flight[future]
+                    self._in_flight_bytes -= cost
+            self._admit(executor, job)
+
+    def run(self, paths, job=fspy.Project):
+        """Runs job(path) for every path and yields a JobResult for each as it finishes
+        
+        Jobs start while paths is still being read. Files whose headers
+        can't be read are yielded as failures without running.
+        """
+        executor = self._executor or ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for order, path in enumerate(paths):
+                try:
+                    cost = self.get_cost(path)
+                except (OSError, fspy.ParsingError) as e:
+                    yield JobResult(path, None, e, 0)
+                    continue
+                with self._lock:
+                    bisect.insort(self._queue, (cost, order, path))
+                self._admit(executor, job)
+                yield from self._drain(executor, job, block=False)
+
+            self._admit(executor, job)
+            while self._in_flight:
+                yield from self._drain(executor, job, block=True)
+        finally:
+            with self._lock:
+                self._queue = []
+            if self._executor is None:
+                executor.shutdown(wait=True)
+            with self._lock:
+                self._in_flight = {}
+                self._in_flight_bytes = 0
@@ -0,0 +1,269 @@
+"""A columnar binary format for per-frame camera solves
+
+A track file is a header, then one packed little endian float64 array per
+column with a row per frame, then a JSON list of the source projects.
+Loading maps the file and wraps the columns as NumPy arrays without copying.
+"""
+import os
+import re
+import json
+import mmap
+import collections
+from struct import *
+
+import numpy as np
+
+from fspy_maya import fspy
+from fspy_maya import conversion
+
+
+TRACK_ID = b'FSPT'
+TRACK_VERSION = 1
+#id, version, column count, frame count, plates offset, plates size
+HEADER_FORMAT = '<4sHHIQQ'
+#the columns start here, padded so they're 8 byte aligned
+DATA_OFFSET = 64
+
+#(name, values per frame) in file order
+COLUMNS = [
+    ('frame', 1),
+    ('transform', 16),
+    ('fov', 2),
+    ('principal_point', 2),
+    ('image_size', 2),
+    #an index into conversion.REFERENCE_DISTANCE_UNITS
+    ('unit', 1),
+    ('z_up', 1),
+]
+
+
+def get_frame_number(path, default):
+    """Returns the last number in a file name, e.g. 1001 for shot_010.1001.fspy"""
+    numbers = re.findall(r'\d+', os.path.splitext(os.path.basename(path))[0])
+    return int(numbers[-1]) if numbers else default
+
+
+def _get_unit_index(unit):
+    if unit not in conversion.REFERENCE_DISTANCE_UNITS:
+        unit = 'Centimeters'
+    return conversion.REFERENCE_DISTANCE_UNITS.index(unit)
+
+
+def write_track(track_path, project_paths, frames=None):
+    """Writes the camera solves of many .fspy files to one track file
+
+    Parameters:
+    -----------
+    project_paths : list
+        The .fspy files, in frame order
+    frames : list
+        A frame number per project, defaults to the last number in each file name
+
+    Returns:
+    --------
+    int
+        The number of frames written
+    """
+    frame_count = len(project_paths)
+    data = {name: np.empty((frame_count, width), dtype='<f8') for name, width in COLUMNS}
+    for idx, path in enumerate(project_paths):
+        project = fspy.Project(path, load_image=False)
+        params = project.camera_parameters
+        data['frame'][idx] = frames[idx] if frames is not None else get_frame_number(path, idx + 1)
+        data['transform'][idx] = [value for row in params.camera_transform for value in row]
+        data['fov'][idx] = (params.fov_horiz, params.fov_vertical)
+        data['principal_point'][idx] = params.principal_point
+        data['image_size'][idx] = (params.image_width, params.image_height)
+        data['unit'][idx] = _get_unit_index(project.reference_distance_unit)
+        data['z_up'][idx] = project.z_up
+
+    plates = json.dumps([os.path.abspath(path) for path in project_paths]).encode('utf-8')
+    plates_offset = DATA_OFFSET + sum(data[name].nbytes for name, width in COLUMNS)
+    header = pack(HEADER_FORMAT, TRACK_ID, TRACK_VERSION, len(COLUMNS), frame_count,
+                  plates_offset, len(plates))
+
+    with open(track_path, 'wb') as track_file:
+        track_file.write(header.ljust(DATA_OFFSET, b'\0'))
+        for name, width in COLUMNS:
+            track_file.write(data[name].tobytes())
+        track_file.write(plates)
+    return frame_count
+
+
+class Track:
+    """A memory mapped track file
+
+    Every column is a read-only (frames, width) NumPy view of the file,
+    e.g. track.transform[10] is frame 10's camera transform, row by row.
+    Close it, or use it in a with block, once the arrays are no longer used.
+    """
+    def __init__(self, track_path):
+        self.path = track_path
+        with open(track_path, 'rb') as track_file:
+            self._map = mmap.mmap(track_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < DATA_OFFSET:
+            raise fspy.ParsingError("Trying to read a file that is not an fSpy track")
+        track_id, version, column_count, frame_count, plates_offset, plates_size = unpack_from(HEADER_FORMAT, self._map)
+        if track_id != TRACK_ID:
+            raise fspy.ParsingError("Trying to read a file that is not an fSpy track")
+        if version != TRACK_VERSION or column_count != len(COLUMNS):
+            raise fspy.ParsingError("Unsupported fSpy track version " + str(version))
+        if plates_offset + plates_size > len(self._map):
+            raise fspy.ParsingError("The fSpy track is truncated")
+        #a corrupt frame count would run the columns into the plates or past the end
+        if DATA_OFFSET + frame_count * sum(width for name, width in COLUMNS) * 8 > plates_offset:
+            raise fspy.ParsingError("The fSpy track's frame count doesn't fit its columns")
+
+        self.frame_count = frame_count
+        self._plates_range = (plates_offset, plates_offset + plates_size)
+        self._plates = None
+
+        offset = DATA_OFFSET
+        for name, width in COLUMNS:
+            column = np.frombuffer(self._map, dtype='<f8', count=frame_count * width, offset=offset)
+            setattr(self, name, column.reshape(frame_count, width))
+            offset += column.nbytes
+
+    @property
+    def frames(self):
+        return self.frame[:, 0]
+
+    @property
+    def plates(self):
+        """The source project of each frame, only decoded when asked for"""
+        if self._plates is None:
+            start, end = self._plates_range
+            self._plates = json.loads(self._map[start:end].decode('utf-8'))
+        return self._plates
+
+    def close(self):
+        for name, width in COLUMNS:
+            setattr(self, name, None)
+        try:
+            self._map.close()
+        except BufferError:
+            #someone still holds a column, the map closes when they let go
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def get_camera_values(track, horizontal_aperture=conversion.DEFAULT_HORIZONTAL_APERTURE, maya_up_axis='y'):
+    """conversion.get_camera_values() for every frame at once
+
+    Returns:
+    --------
+    conversion.CameraValues
+        Each field holds an array with a value per frame, translate and
+        rotate are (frames, 3). Rotations are unwrapped so they don't flip
+        between frames.
+    """
+    frame_count = track.frame_count
+    #the fSpy to Maya matrix only depends on the unit and up-axis, so look each pair up once
+    keys = track.unit[:, 0].astype(int) * 2 + track.z_up[:, 0].astype(int)
+    conversions = np.empty((frame_count, 4, 4))
+    for key in np.unique(keys):
+        unit = conversion.REFERENCE_DISTANCE_UNITS[key // 2]
+        conversions[keys == key] = conversion.get_conversion_matrix(unit, bool(key % 2), maya_up_axis)
+
+    rows = np.matmul(conversions, track.transform.reshape(frame_count, 4, 4))
+    scale = rows[:, 3, 3]
+    #Maya's layout is the transpose of fSpy's, see conversion.get_maya_matrix()
+    rotation = rows[:, :3, :3].transpose(0, 2, 1) / scale[:, None, None]
+    translate = rows[:, :3, 3]
+
+    sin_y = np.clip(-rotation[:, 0, 2], -1.0, 1.0)
+    gimbal = np.abs(sin_y) >= 1.0 - 1e-9
+    rotate_x = np.where(gimbal, 0.0, np.arctan2(rotation[:, 1, 2], rotation[:, 2, 2]))
+    rotate_z = np.where(gimbal, np.arctan2(-rotation[:, 1, 0], rotation[:, 1, 1]),
+                        np.arctan2(rotation[:, 0, 1], rotation[:, 0, 0]))
+    rotate = np.unwrap(np.stack([rotate_x, np.arcsin(sin_y), rotate_z], axis=1), axis=0)
+
+    fov_horiz, fov_vertical = track.fov[:, 0], track.fov[:, 1]
+    aspect_ratio = track.image_size[:, 0] / track.image_size[:, 1]
+    focal_length = horizontal_aperture * 25.4 / (2.0 * np.tan(fov_horiz / 2.0))
+    horizontal_apertures = np.full(frame_count, float(horizontal_aperture))
+    return conversion.CameraValues(translate, rotate, focal_length, fov_horiz, fov_vertical,
+                                   horizontal_apertures, horizontal_aperture / aspect_ratio,
+                                   -(horizontal_aperture * track.principal_point[:, 0]) / 2.0,
+                                   -(horizontal_aperture * track.principal_point[:, 1]) / 2.0)
+
+
+#the curve left after reduce_keys(), static_segments being (start time, end time) pairs
+ReducedCurve = collections.namedtuple('ReducedCurve', ['times', 'values', 'removed', 'static_segments'])
+
+
+def _get_static_segments(times, values, tolerance):
+    #reduced keys within tolerance of each other have every sample between them near flat
+    flat = np.abs(np.diff(values)) <= tolerance
+    edges = np.diff(np.concatenate([[0], flat.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [(times[start], times[end]) for start, end in zip(starts, ends)]
+
+
+def _get_removal_errors(times, values, kept):
+    """Returns, for each interior kept key, the worst error of dropping it
+    
+    Dropping kept[j] replaces the segments either side of it with one line
+    from kept[j - 1] to kept[j + 1], checked against every original sample.
+    """
+    segment = np.searchsorted(kept, np.arange(len(values)), side='right') - 1
+    segment = np.clip(segment, 0, len(kept) - 2)
+
+    def line_errors(start_keys, end_keys):
+        start, end = kept[start_keys], kept[end_keys]
+        span = times[end] - times[start]
+        weight = (times - times[start]) / span
+        return np.abs(values[start] + (values[end] - values[start]) * weight - values)
+
+    #samples in segment s are the right half of dropping kept[s] and the left half of dropping kept[s + 1]
+    right_errors = line_errors(np.maximum(segment - 1, 0), segment + 1)
+    left_errors = line_errors(segment, np.minimum(segment + 2, len(kept) - 1))
+
+    starts = kept[:-1]
+    worst_left = np.maximum.reduceat(left_errors, starts)
+    worst_right = np.maximum.reduceat(right_errors, starts)
+    return np.maximum(worst_left[:-1], worst_right[1:])
+
+
+def reduce_keys(times, values, tolerance):
+    """Drops keys a linear curve through the rest still passes within tolerance of
+    
+    Every pass drops every other removable key, so two dropped keys never
+    share a span, and checks against all of the original samples. A channel
+    that never moves more than tolerance keeps a single key.
+    
+    Returns:
+    --------
+    ReducedCurve
+    """
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    count = len(values)
+    if count < 3:
+        return ReducedCurve(times, values, 0, _get_static_segments(times, values, tolerance))
+    if np.ptp(values) <= tolerance:
+        return ReducedCurve(times[:1], values[:1], count - 1, [(times[0], times[-1])])
+
+    kept = np.arange(count)
+    parity = 0
+    idle_passes = 0
+    while len(kept) > 2 and idle_passes < 2:
+        errors = _get_removal_errors(times, values, kept)
+        interior = np.arange(1, len(kept) - 1)
+        removable = (errors <= tolerance) & (interior % 2 == parity)
+        parity = 1 - parity
+        if removable.any():
+            kept = np.delete(kept, interior[removable])
+            idle_passes = 0
+        else:
+            idle_passes += 1
+
+    return ReducedCurve(times[kept], values[kept], count - len(kept),
+                        _get_static_segments(times[kept], values[kept], tolerance))
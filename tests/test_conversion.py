@@ -0,0 +1,107 @@
+import copy
+import math
+import random
+import itertools
+
+import pytest
+
+from fspy_maya import fspy
+from fspy_maya import fuzz
+from fspy_maya import conversion
+
+
+AXES = {
+    'xPositive': (1, 0, 0), 'xNegative': (-1, 0, 0),
+    'yPositive': (0, 1, 0), 'yNegative': (0, -1, 0),
+    'zPositive': (0, 0, 1), 'zNegative': (0, 0, -1),
+}
+
+#every pair of vanishing point axes fSpy allows, the two can't be parallel
+AXIS_PAIRS = [(first, second) for first, second in itertools.permutations(AXES, 2) if first[0] != second[0]]
+
+
+def _old_camera_matrix(project):
+    #set_camera() before the conversion table, for a Y-up Maya scene
+    scale_length = conversion.UNIT_SCALES.get(project.reference_distance_unit, 1)
+    transform_rows = copy.deepcopy(project.camera_parameters.camera_transform)
+    for row in transform_rows:
+        for idx in range(0, len(row)):
+            row[idx] = row[idx] * scale_length
+
+    if project.z_up:
+        y, z = copy.copy(transform_rows[1]), copy.copy(transform_rows[2])
+        transform_rows[1] = z
+        transform_rows[2] = [-value for value in y]
+    return transform_rows
+
+
+def _old_maya_point(project, point):
+    scale_length = conversion.UNIT_SCALES.get(project.reference_distance_unit, 1)
+    x, y, z = [value * scale_length for value in point]
+    if project.z_up:
+        return (x, z, -y)
+    return (x, y, z)
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _random_rotation(rng):
+    x, y, z = [rng.uniform(-math.pi, math.pi) for _ in range(3)]
+    rotate_x = ((1, 0, 0), (0, math.cos(x), -math.sin(x)), (0, math.sin(x), math.cos(x)))
+    rotate_y = ((math.cos(y), 0, math.sin(y)), (0, 1, 0), (-math.sin(y), 0, math.cos(y)))
+    rotate_z = ((math.cos(z), -math.sin(z), 0), (math.sin(z), math.cos(z), 0), (0, 0, 1))
+    multiply = lambda a, b: [[sum(a[row][idx] * b[idx][col] for idx in range(3)) for col in range(3)] for row in range(3)]
+    return multiply(multiply(rotate_z, rotate_y), rotate_x)
+
+
+def _make_project(rng, unit, z_up, axis_pair):
+    #the vanishing point axes decide which world axes the solved camera is aligned with
+    first, second = AXES[axis_pair[0]], AXES[axis_pair[1]]
+    axes = [first, second, _cross(first, second)]
+    rotation = _random_rotation(rng)
+    rows = [[sum(axes[idx][row] * rotation[idx][col] for idx in range(3)) for col in range(3)] + [rng.uniform(-10, 10)]
+            for row in range(3)]
+    rows.append([0, 0, 0, 1])
+
+    state = fuzz.make_state()
+    state['cameraParameters']['cameraTransform']['rows'] = rows
+    state['cameraParameters']['vanishingPointAxes'] = list(axis_pair) + [None]
+    state['calibrationSettingsBase']['referenceDistanceUnit'] = unit
+    state['globalSettings']['overlay3DGuide'] = 'xyGridPlane' if z_up else 'none'
+    return fspy.Project(fuzz.make_project(state))
+
+
+def _flatten(matrix):
+    return [value for row in matrix for value in row]
+
+
+@pytest.mark.parametrize('unit', conversion.REFERENCE_DISTANCE_UNITS + ['Parsecs'])
+@pytest.mark.parametrize('z_up', [False, True])
+def test_table_matches_the_old_per_axis_code(unit, z_up):
+    rng = random.Random('{0}{1}'.format(unit, z_up))
+    for axis_pair in AXIS_PAIRS:
+        project = _make_project(rng, unit, z_up, axis_pair)
+        assert project.z_up == z_up
+
+        expected = _old_camera_matrix(project)
+        assert _flatten(conversion.get_camera_matrix(project, 'y')) == pytest.approx(_flatten(expected), abs=1e-9)
+        point = [rng.uniform(-10, 10) for _ in range(3)]
+        assert conversion.to_maya_point(project, point, 'y') == pytest.approx(_old_maya_point(project, point), abs=1e-9)
+
+
+@pytest.mark.parametrize('unit', conversion.REFERENCE_DISTANCE_UNITS)
+@pytest.mark.parametrize('z_up', [False, True])
+def test_z_up_scenes_get_the_y_up_result_turned_onto_z(unit, z_up):
+    #Maya's Y-up to Z-up turn, (x, y, z) -> (x, -z, y)
+    y_to_z = ((1, 0, 0, 0), (0, 0, -1, 0), (0, 1, 0, 0), (0, 0, 0, 1))
+    assert conversion.get_conversion_matrix(unit, z_up, 'z') == conversion.multiply_matrices(
+        y_to_z, conversion.get_conversion_matrix(unit, z_up, 'y'))
+
+
+def test_the_project_up_axis_lands_on_maya_up():
+    for z_up, up in ((False, (0, 1, 0)), (True, (0, 0, 1))):
+        project = _make_project(random.Random(0), 'Meters', z_up, AXIS_PAIRS[0])
+        assert conversion.to_maya_point(project, up, 'y') == pytest.approx((0, 100, 0))
+        assert conversion.to_maya_point(project, up, 'z') == pytest.approx((0, 0, 100))
@@ -0,0 +1,123 @@
+import os
+import random
+import hashlib
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from fspy_maya.fspy_installer import Downloader, DownloadError
+
+
+DATA = random.Random(0).getrandbits(8 * 512 * 1024).to_bytes(512 * 1024, 'little')
+ETAG = '"v1"'
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(dict(self.headers))
+            failure = server.failures.pop(0) if server.failures else None
+
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        start = 0
+        if self.headers.get('Range') and self.headers.get('If-Range', ETAG) == ETAG:
+            start = int(self.headers['Range'].split('=')[1].rstrip('-'))
+        body = DATA[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header('ETag', ETAG)
+        if start:
+            self.send_header('Content-Range', 'bytes {0}-{1}/{2}'.format(start, len(DATA) - 1, len(DATA)))
+        if failure == 'chunked':
+            #like a codeload response cut off mid-stream
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            half = body[:len(body) // 2]
+            self.wfile.write('{0:x}\r\n'.format(len(half)).encode() + half + b'\r\n')
+        else:
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[:len(body) // 2] if failure == 'drop' else body)
+        if failure:
+            self.close_connection = True
+
+
+@pytest.fixture
+def server():
+    server = _Server(('127.0.0.1', 0), _Handler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.failures = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = 'http://127.0.0.1:{0}/main.zip'.format(server.server_address[1])
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_dropped_download_resumes(server, tmp_path):
+    server.failures = ['drop']
+    path = Downloader(str(tmp_path), retry_delay=0).download(server.url)
+    assert _read(path) == DATA
+    assert server.requests[1]['Range'] == 'bytes={0}-'.format(len(DATA) // 2)
+
+
+def test_truncated_chunked_download_is_retried(server, tmp_path):
+    server.failures = ['chunked']
+    path = Downloader(str(tmp_path), retry_delay=0).download(server.url, sha256=hashlib.sha256(DATA).hexdigest())
+    assert _read(path) == DATA
+
+
+def test_cached_download_is_revalidated(server, tmp_path):
+    downloader = Downloader(str(tmp_path), retry_delay=0)
+    path = downloader.download(server.url)
+    assert downloader.download(server.url) == path
+    assert server.requests[-1]['If-None-Match'] == ETAG
+    assert _read(path) == DATA
+
+
+def test_checksum_mismatch_fails(server, tmp_path):
+    with pytest.raises(DownloadError):
+        Downloader(str(tmp_path), retry_delay=0).download(server.url, sha256='0' * 64)
+
+
+def test_concurrent_downloads_of_one_url_take_turns(server, tmp_path):
+    downloader = Downloader(str(tmp_path), retry_delay=0)
+    paths = []
+    def download():
+        paths.append(downloader.download(server.url))
+
+    threads = [threading.Thread(target=download) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(paths) == 8 and len(set(paths)) == 1
+    assert _read(paths[0]) == DATA
+    #one download, the rest revalidated the finished file
+    assert sum(1 for headers in server.requests if 'If-None-Match' not in headers) == 1
+    assert not os.path.exists(paths[0] + '.part')
@@ -0,0 +1,24 @@
+import io
+import hashlib
+
+from fspy_maya import fspy
+from fspy_maya import fuzz
+
+
+def test_content_hash_is_the_file_hash(tmp_path):
+    data = fuzz.make_project()
+    path = tmp_path / 'shot.fspy'
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+
+    assert fspy.Project(data).content_hash == expected
+    assert fspy.Project(io.BytesIO(data)).content_hash == expected
+    assert fspy.Project(str(path)).content_hash == expected
+    #read from the file, since the image wasn't loaded
+    assert fspy.Project(str(path), load_image=False).content_hash == expected
+
+
+def test_content_hash_without_the_image_is_none():
+    data = fuzz.make_project()
+    assert fspy.Project(data, load_image=False).content_hash is None
+    assert fspy.Project(io.BytesIO(data), load_image=False).content_hash is None
@@ -0,0 +1,46 @@
+import os
+import asyncio
+
+import pytest
+
+from fspy_maya import fspy
+from fspy_maya import fuzz
+from fspy_maya import fspy_aio
+
+
+def _write_projects(folder, image_sizes):
+    paths = []
+    for idx, size in enumerate(image_sizes):
+        path = os.path.join(folder, 'shot_{0}.fspy'.format(idx))
+        with open(path, 'wb') as project_file:
+            project_file.write(fuzz.make_project(image=bytes([idx]) * size))
+        paths.append(path)
+    return paths
+
+
+def test_projects_are_read_whole(tmp_path):
+    #plates smaller than, around and well past the prefetch
+    sizes = [10, fspy_aio.PREFETCH_SIZE - 500, fspy_aio.PREFETCH_SIZE, 3 * fspy_aio.PREFETCH_SIZE + 7]
+    paths = _write_projects(str(tmp_path), sizes)
+
+    projects = {project.source_path: project for project in fspy_aio.load_all(paths, limit=2)}
+    assert sorted(projects) == sorted(os.path.abspath(path) for path in paths)
+    for idx, (path, size) in enumerate(zip(paths, sizes)):
+        project = projects[os.path.abspath(path)]
+        assert bytes(project.image_data) == bytes([idx]) * size
+        assert project.file_name == os.path.basename(path)
+
+    for project in fspy_aio.load_all(paths, load_image=False):
+        assert project.image_data is None
+
+
+def test_errors_are_raised(tmp_path):
+    paths = _write_projects(str(tmp_path), [100, 100])
+    with open(paths[1], 'wb') as project_file:
+        project_file.write(b'not an fspy file')
+
+    async def collect():
+        return [project async for project in fspy_aio.load_many(paths, prefetch_size=16)]
+
+    with pytest.raises(fspy.ParsingError):
+        asyncio.run(collect())
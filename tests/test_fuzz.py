@@ -0,0 +1,9 @@
+from fspy_maya import fuzz
+
+
+def test_fuzzed_projects_only_raise_parsing_errors():
+    stats, failures = fuzz.run(iterations=300, seed=0)
+    assert [(failure.mutation, failure.source, failure.error) for failure in failures] == []
+    #every mutation got exercised, from all three sources
+    assert set(stats) == set(fuzz.MUTATIONS)
+    assert sum(stat.count for stat in stats.values()) == 300 * 3
@@ -0,0 +1,36 @@
+import os
+
+from fspy_maya import fuzz
+from fspy_maya import headless
+
+
+def _write_project(path):
+    folder = os.path.dirname(path)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    with open(path, 'wb') as project_file:
+        project_file.write(fuzz.make_project())
+
+
+def test_recursive_outputs_mirror_the_input_folders(tmp_path):
+    input_dir = str(tmp_path / 'in')
+    output_dir = str(tmp_path / 'out')
+    for folder in ('a', 'b'):
+        _write_project(os.path.join(input_dir, folder, 'shot.fspy'))
+
+    results = headless.convert_directory(input_dir, output_dir, workers=2, recursive=True, formats=('ma',))
+    assert [result.error for result in results] == ['', '']
+    outputs = sorted(os.path.relpath(output, output_dir) for result in results for output in result.outputs)
+    assert outputs == [os.path.join('a', 'shot.ma'), os.path.join('a', 'shot.png'),
+                       os.path.join('b', 'shot.ma'), os.path.join('b', 'shot.png')]
+
+
+def test_clashing_names_fail_instead_of_overwriting(tmp_path):
+    input_dir = str(tmp_path / 'in')
+    for file_name in ('shot 1.fspy', 'shot_1.fspy'):
+        _write_project(os.path.join(input_dir, file_name))
+
+    results = headless.convert_directory(input_dir, str(tmp_path / 'out'), workers=1, formats=('ma',))
+    assert len(results) == 2
+    assert not results[0].error
+    assert results[1].error and not results[1].outputs
@@ -0,0 +1,203 @@
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import zipfile
+import subprocess
+import multiprocessing
+
+from fspy_maya import fspy_installer
+from fspy_maya.fspy_installer import ModuleManager, ModuleDefinition, ModuleDefinitionStore, DeploymentTarget, Platforms
+
+
+def _record_line(name, data):
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b'=').decode()
+    return '{0},sha256={1},{2}'.format(name, digest, len(data))
+
+
+def _write_wheel(wheelhouse, version):
+    #a minimal fspy-maya wheel, so pip installs it with no network and no build backend
+    files = {
+        'fspy_maya/__init__.py': b'VERSION = ' + repr(version).encode() + b'\n',
+        'fspy_maya/fspy_plugin.py': b'#plug-in\n',
+        'fspy_maya-{0}.dist-info/METADATA'.format(version):
+            'Metadata-Version: 2.1\nName: fspy-maya\nVersion: {0}\n'.format(version).encode(),
+        'fspy_maya-{0}.dist-info/WHEEL'.format(version):
+            b'Wheel-Version: 1.0\nGenerator: tests\nRoot-Is-Purelib: true\nTag: py3-none-any\n',
+    }
+    record_name = 'fspy_maya-{0}.dist-info/RECORD'.format(version)
+    record = [_record_line(name, data) for name, data in files.items()] + [record_name + ',,']
+    files[record_name] = ('\n'.join(record) + '\n').encode()
+
+    path = os.path.join(wheelhouse, 'fspy_maya-{0}-py3-none-any.whl'.format(version))
+    with zipfile.ZipFile(path, 'w') as wheel:
+        for name, data in files.items():
+            wheel.writestr(name, data)
+
+    manifest = {filename: ModuleManager.file_hash(os.path.join(wheelhouse, filename))
+                for filename in os.listdir(wheelhouse) if filename.endswith('.whl')}
+    with open(os.path.join(wheelhouse, ModuleManager.WHEELHOUSE_MANIFEST), 'w') as f:
+        json.dump({'files': manifest}, f)
+
+
+def _create_installer(tmp_path, wheelhouse):
+    return fspy_installer.create_installer(maya_version=2024, platform=Platforms.LINUX,
+                                           install_root=str(tmp_path / 'modules'), wheelhouse=wheelhouse)
+
+
+def test_a_tampered_install_is_put_back(tmp_path):
+    wheelhouse = str(tmp_path / 'wheelhouse')
+    os.makedirs(wheelhouse)
+    _write_wheel(wheelhouse, '1.0')
+
+    installer = _create_installer(tmp_path, wheelhouse)
+    assert installer.pre_install()
+    assert installer.install()
+    init_path = os.path.join(installer.package_install_path, '__init__.py')
+    with open(init_path, 'rb') as f:
+        original = f.read()
+
+    with open(init_path, 'ab') as f:
+        f.write(b'tampered = True\n')
+    assert not installer.files_match_manifest(installer.package_install_path)
+
+    installer = _create_installer(tmp_path, wheelhouse)
+    assert installer.pre_install()
+    assert installer.install()
+    with open(init_path, 'rb') as f:
+        assert f.read() == original
+    assert installer.files_match_manifest(installer.package_install_path)
+
+
+def test_an_upgrade_replaces_the_old_version(tmp_path):
+    wheelhouse = str(tmp_path / 'wheelhouse')
+    os.makedirs(wheelhouse)
+    _write_wheel(wheelhouse, '1.0')
+    installer = _create_installer(tmp_path, wheelhouse)
+    assert installer.pre_install() and installer.install()
+
+    _write_wheel(wheelhouse, '1.1')
+    installer = _create_installer(tmp_path, wheelhouse)
+    assert installer.pre_install() and installer.install()
+    assert installer.get_installed_version() == '1.1'
+    assert [name for name in os.listdir(installer.scripts_path) if name.endswith('.dist-info')] == [
+        'fspy_maya-1.1.dist-info']
+
+
+#the installer is dragged into a Maya viewport, so it has to come up quickly
+STARTUP_SECONDS = 2.0
+
+
+def test_installer_starts_quickly(tmp_path):
+    #a fresh interpreter, so the import and the class level resources are timed too
+    code = ('import sys, time\n'
+            'start = time.perf_counter()\n'
+            'from fspy_maya import fspy_installer\n'
+            'fspy_installer.create_installer(maya_version=2024, platform=fspy_installer.Platforms.LINUX,\n'
+            '                                install_root=sys.argv[1])\n'
+            'seconds = time.perf_counter() - start\n'
+            '#the preloader gif is only decoded when the UI shows it\n'
+            'assert fspy_installer.Resources._byte_gif is None\n'
+            'print(seconds)\n')
+    output = subprocess.check_output([sys.executable, '-c', code, str(tmp_path)])
+    assert float(output.decode().split()[-1]) < STARTUP_SECONDS
+
+
+def _add_definitions(args):
+    path, worker, count, start = args
+    #line every process up so the edits really overlap
+    time.sleep(max(0.0, start - time.time()))
+    store = ModuleDefinitionStore.get(path)
+    for idx in range(count):
+        with store.locked():
+            store.add(ModuleDefinition('module_{0}_{1}'.format(worker, idx), '1.0', maya_version=2024,
+                                       platform='linux', module_path='./module'))
+            store.save()
+
+
+def _leftovers(folder):
+    return [filename for filename in os.listdir(folder) if filename.endswith(('.lock', '.tmp'))]
+
+
+def test_concurrent_module_edits_keep_every_entry(tmp_path):
+    path = str(tmp_path / 'fspy.mod')
+    open(path, 'w').close()
+    os.chmod(path, 0o640)
+
+    workers, count = 8, 10
+    start = time.time() + 0.5
+    with multiprocessing.Pool(workers) as pool:
+        pool.map(_add_definitions, [(path, worker, count, start) for worker in range(workers)])
+
+    store = ModuleDefinitionStore(path)
+    store.refresh()
+    names = sorted(definition.module_name for definition in store.definitions())
+    assert names == sorted('module_{0}_{1}'.format(worker, idx) for worker in range(workers) for idx in range(count))
+    assert os.stat(path).st_mode & 0o7777 == 0o640
+    assert not _leftovers(str(tmp_path))
+
+
+def test_a_new_module_file_gets_default_permissions(tmp_path):
+    path = str(tmp_path / 'fspy.mod')
+    store = ModuleDefinitionStore(path)
+    with store.locked():
+        store.add(ModuleDefinition('fspy_maya', '1.0', module_path='./fspy_maya'))
+        store.save()
+
+    assert os.stat(path).st_mode & 0o7777 == 0o666 & ~fspy_installer.UMASK
+    assert not _leftovers(str(tmp_path))
+
+
+class _StubInstaller(object):
+    #stands in for create_installer(), the install_root names the scripts folder and how it behaves
+    runs = []
+
+    def __init__(self, maya_version, platform, install_root, **kwargs):
+        self.install_root = install_root
+        self.scripts_path = os.path.join(install_root, 'scripts')
+        self.install_succeeded = False
+        self.kwargs = kwargs
+
+    def pre_install(self):
+        if 'unwritable' in self.install_root:
+            raise OSError('Permission denied: ' + self.install_root)
+        return True
+
+    def run(self):
+        _StubInstaller.runs.append(self.scripts_path)
+        #give the other target sharing this folder a chance to race for it
+        time.sleep(0.05)
+        self.install_succeeded = 'bad_wheel' not in self.install_root
+
+    def post_install(self):
+        pass
+
+
+def test_deploy_reports_each_target(tmp_path):
+    _StubInstaller.runs = []
+    shared, bad_wheel, unwritable = [str(tmp_path / name) for name in ('shared', 'bad_wheel', 'unwritable')]
+    targets = [DeploymentTarget(2024, 'linux', shared), DeploymentTarget(2025, 'linux', shared),
+               DeploymentTarget(2024, 'linux', unwritable), DeploymentTarget(2024, 'linux', bad_wheel)]
+
+    results = fspy_installer.deploy(targets, max_workers=4, installer_factory=_StubInstaller, wheelhouse='wheels')
+
+    assert [result.target for result in results] == targets
+    assert [result.succeeded for result in results] == [True, True, False, False]
+    assert results[0].error == results[1].error == ''
+    assert 'Permission denied' in results[2].error
+    assert results[3].error == 'Package install failed'
+    #the two targets sharing a scripts folder only installed once, the unwritable one never got that far
+    assert sorted(_StubInstaller.runs) == sorted([os.path.join(shared, 'scripts'), os.path.join(bad_wheel, 'scripts')])
+
+
+def test_headless_main_exit_code(tmp_path, monkeypatch, capsys):
+    deploy = fspy_installer.deploy
+    monkeypatch.setattr(fspy_installer, 'deploy',
+                        lambda targets, **kwargs: deploy(targets, installer_factory=_StubInstaller, **kwargs))
+    good, bad = '2024:linux:' + str(tmp_path / 'good'), '2024:linux:' + str(tmp_path / 'unwritable')
+
+    assert fspy_installer.headless_main(['--target', good]) == 0
+    assert fspy_installer.headless_main(['--target', good, '--target', bad]) == 1
+    assert 'FAILED' in capsys.readouterr().out
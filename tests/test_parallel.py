@@ -0,0 +1,76 @@
+import os
+import sys
+import subprocess
+from multiprocessing import shared_memory
+
+import pytest
+
+from fspy_maya import fspy
+from fspy_maya import fuzz
+from fspy_maya import parallel
+
+
+def test_maya_free_modules_dont_import_core():
+    #spawned workers import fspy_maya.fspy, which mustn't bring in pymel
+    code = ('import sys, fspy_maya\n'
+            'from fspy_maya import fspy, conversion, parallel\n'
+            'assert fspy_maya.fspy is fspy\n'
+            'assert "fspy_maya.core" not in sys.modules and "pymel" not in sys.modules\n')
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def _write_projects(folder):
+    paths = []
+    for idx in range(4):
+        path = os.path.join(folder, 'shot_{0}.fspy'.format(idx))
+        with open(path, 'wb') as project_file:
+            project_file.write(fuzz.make_project(image=bytes([idx]) * (1000 + idx)))
+        paths.append(path)
+
+    broken = os.path.join(folder, 'broken.fspy')
+    with open(broken, 'wb') as project_file:
+        project_file.write(fuzz.make_project()[:40])
+    return paths, [broken, os.path.join(folder, 'missing.fspy')]
+
+
+def _segment_exists(name):
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+@pytest.mark.parametrize('transfer', [parallel.OFFSETS, parallel.SHARED_MEMORY])
+def test_good_and_bad_projects_load(tmp_path, transfer):
+    good, bad = _write_projects(str(tmp_path))
+    segments = []
+    results = {}
+    for handle in parallel.load_projects(good + bad, workers=2, transfer=transfer):
+        with handle:
+            if handle.error is None:
+                results[handle.path] = bytes(handle.project.image_data)
+                if handle.descriptor.shared_memory_name:
+                    segments.append(handle.descriptor.shared_memory_name)
+            else:
+                results[handle.path] = handle.error
+
+    for idx, path in enumerate(good):
+        assert results[path] == bytes([idx]) * (1000 + idx)
+    assert isinstance(results[bad[0]], fspy.ParsingError)
+    assert isinstance(results[bad[1]], OSError)
+
+    if transfer == parallel.SHARED_MEMORY and sys.platform != 'win32':
+        assert len(segments) == len(good)
+    assert not any(_segment_exists(name) for name in segments)
+
+
+@pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason='needs a POSIX /dev/shm to list segments')
+def test_stopping_early_releases_the_rest(tmp_path):
+    good, bad = _write_projects(str(tmp_path))
+    before = set(os.listdir('/dev/shm'))
+    for handle in parallel.load_projects(good, workers=2, transfer=parallel.SHARED_MEMORY):
+        handle.release()
+        break
+    assert set(os.listdir('/dev/shm')) - before == set()
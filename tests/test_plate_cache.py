@@ -0,0 +1,111 @@
+import os
+import time
+import hashlib
+import multiprocessing
+
+from fspy_maya.plate_cache import SharedPlateCache, get_image_extension
+
+
+PNG_HEADER = b'\x89PNG\r\n\x1a\n'
+
+
+def _plate(seed, size=256 * 1024):
+    return PNG_HEADER + hashlib.sha256(str(seed).encode()).digest() * (size // 32)
+
+
+def _store(args):
+    root, seed, start = args
+    #line every process up so the stores really overlap
+    time.sleep(max(0.0, start - time.time()))
+    return SharedPlateCache(root, poll_seconds=0.001).store(_plate(seed))
+
+
+def _store_all(root, seeds):
+    start = time.time() + 0.5
+    with multiprocessing.Pool(len(seeds)) as pool:
+        return pool.map(_store, [(root, seed, start) for seed in seeds])
+
+
+def _leftovers(root):
+    return [file_name for folder, dirs, files in os.walk(root) for file_name in files
+            if file_name.endswith(('.lock', '.tmp', '.broken'))]
+
+
+def test_concurrent_stores_of_one_plate_write_it_once(tmp_path):
+    root = str(tmp_path)
+    paths = _store_all(root, [0] * 8)
+
+    assert len(set(paths)) == 1
+    assert paths[0].endswith('.png')
+    with open(paths[0], 'rb') as plate_file:
+        assert plate_file.read() == _plate(0)
+    assert len(SharedPlateCache(root).entries()) == 1
+    assert not _leftovers(root)
+
+
+def test_concurrent_stores_of_different_plates(tmp_path):
+    root = str(tmp_path)
+    seeds = [0, 1, 2, 3, 0, 1, 2, 3]
+    paths = _store_all(root, seeds)
+
+    assert len(set(paths)) == 4
+    for seed, path in zip(seeds, paths):
+        with open(path, 'rb') as plate_file:
+            assert plate_file.read() == _plate(seed)
+    assert not _leftovers(root)
+
+
+def test_eviction_removes_the_oldest_plates_under_the_cap(tmp_path):
+    root = str(tmp_path)
+    cache = SharedPlateCache(root)
+    paths = _store_all(root, range(6))
+    size = os.path.getsize(paths[0])
+    for age, path in enumerate(reversed(paths)):
+        os.utime(path, (time.time() - 100 * age, time.time() - 100 * age))
+
+    #a plate being written is skipped, and so is one an open scene uses
+    open(paths[0] + '.lock', 'w').close()
+    removed = cache.evict(3 * size, keep=[paths[1]])
+
+    assert sorted(removed) == sorted(paths[2:5])
+    assert sorted(path for mtime, size, path in cache.entries()) == sorted([paths[0], paths[1], paths[5]])
+
+    #using a plate again makes it the newest
+    cache.store(_plate(0))
+    os.remove(paths[0] + '.lock')
+    assert cache.evict(2 * size) == [paths[1]]
+
+
+def test_a_stale_lock_is_broken(tmp_path):
+    cache = SharedPlateCache(str(tmp_path), stale_lock_seconds=10.0, poll_seconds=0.001)
+    lock_path = cache.get_path(hashlib.sha256(_plate(0)).hexdigest(), 'png') + '.lock'
+    os.makedirs(os.path.dirname(lock_path))
+    with open(lock_path, 'w') as lock_file:
+        lock_file.write('crashed:1:token')
+    os.utime(lock_path, (time.time() - 60, time.time() - 60))
+
+    path = cache.store(_plate(0))
+    assert os.path.exists(path)
+    assert not _leftovers(str(tmp_path))
+
+
+def test_a_broken_holder_leaves_the_new_lock_alone(tmp_path):
+    cache = SharedPlateCache(str(tmp_path))
+    lock_path = str(tmp_path / 'plate.png.lock')
+    with open(lock_path, 'w') as lock_file:
+        lock_file.write('other:2:token')
+
+    cache._release_lock(lock_path, 'mine:1:token')
+    assert os.path.exists(lock_path)
+    cache._release_lock(lock_path, 'other:2:token')
+    assert not os.path.exists(lock_path)
+
+
+def test_image_types_are_recognized():
+    assert get_image_extension(PNG_HEADER + b'\0' * 8) == 'png'
+    assert get_image_extension(memoryview(b'\xff\xd8\xff\xe0\0\x10JFIF')) == 'jpeg'
+    assert get_image_extension(b'v/1\x01\x02\0\0\0') == 'exr'
+    assert get_image_extension(b'II*\0\x08\0\0\0') == get_image_extension(b'MM\0*\0\0\0\x08') == 'tiff'
+    assert get_image_extension(b'GIF89a\x01\0') == 'gif'
+    assert get_image_extension(b'BM\x36\0\0\0') == 'bmp'
+    assert get_image_extension(b'not an image') == get_image_extension(b'') == ''
@@ -0,0 +1,86 @@
+import os
+import json
+import math
+from struct import pack
+
+import pytest
+
+from fspy_maya import fspy
+from fspy_maya import fuzz
+
+
+def _make_state(guide='box'):
+    state = fuzz.make_state()
+    angle = math.radians(30)
+    state['cameraParameters']['cameraTransform']['rows'] = [
+        [math.cos(angle), 0, math.sin(angle), 1.5],
+        [0, 1, 0, 2.0],
+        [-math.sin(angle), 0, math.cos(angle), 5.0],
+        [0, 0, 0, 1],
+    ]
+    state['cameraParameters']['principalPoint'] = {'x': 0.1, 'y': -0.05}
+    state['globalSettings']['overlay3DGuide'] = guide
+    return state
+
+
+def _write_project(path, state, image=b'\x89PNG\r\n\x1a\n' + b'\0' * 64):
+    with open(path, 'wb') as project_file:
+        project_file.write(fuzz.make_project(state, image))
+    return str(path)
+
+
+def test_written_projects_read_back(tmp_path):
+    state = _make_state()
+    image = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 64
+    image_path = tmp_path / 'plate.png'
+    image_path.write_bytes(image)
+
+    fspy.write_project(str(tmp_path / 'out.fspy'), state, str(image_path), chunk_size=1000)
+    state_size = len(json.dumps(state).encode('utf-8'))
+    with open(str(tmp_path / 'out.fspy'), 'rb') as project_file:
+        assert project_file.read(fspy.HEADER_SIZE) == pack('<IIII', fspy.FILE_ID, 1, state_size, len(image))
+    assert os.path.getsize(str(tmp_path / 'out.fspy')) == fspy.HEADER_SIZE + state_size + len(image)
+
+    project = fspy.Project(str(tmp_path / 'out.fspy'))
+    assert project.state == state
+    assert bytes(project.image_data) == image
+    assert project.overlay_3d_guide == 'box' and not project.z_up
+
+
+@pytest.fixture(scope='module')
+def maya():
+    standalone = pytest.importorskip('maya.standalone')
+    standalone.initialize(name='python')
+    import pymel.core as pm
+    from fspy_maya import core
+    return pm, core
+
+
+def _import(pm, core, project):
+    camera = pm.createNode('camera').getParent()
+    core.set_camera(project, camera)
+    return camera
+
+
+@pytest.mark.parametrize('guide', ['box', 'xyGridPlane'])
+def test_import_export_import_gives_the_same_camera(maya, tmp_path, monkeypatch, guide):
+    pm, core = maya
+    monkeypatch.setenv('FSPY_PLATE_CACHE', str(tmp_path / 'plates'))
+    pm.newFile(force=True)
+
+    project = fspy.Project(_write_project(tmp_path / 'in.fspy', _make_state(guide)))
+    camera = _import(pm, core, project)
+    core.export_camera(camera, str(tmp_path / 'out.fspy'), unit=project.reference_distance_unit,
+                       z_up=project.z_up, base_state=project.state)
+
+    exported = fspy.Project(str(tmp_path / 'out.fspy'))
+    assert exported.overlay_3d_guide == guide
+    assert exported.state['controlPointsStateBase'] == project.state['controlPointsStateBase']
+    for exported_row, row in zip(exported.camera_parameters.camera_transform, project.camera_parameters.camera_transform):
+        assert exported_row == pytest.approx(row, abs=1e-6)
+
+    reimported = _import(pm, core, exported)
+    flatten = lambda matrix: [value for row in matrix for value in row]
+    assert flatten(reimported.getMatrix(worldSpace=True)) == pytest.approx(flatten(camera.getMatrix(worldSpace=True)), abs=1e-6)
+    for attr in ('horizontalFilmOffset', 'verticalFilmOffset', 'focalLength', 'verticalFilmAperture'):
+        assert reimported.getShape().attr(attr).get() == pytest.approx(camera.getShape().attr(attr).get(), abs=1e-6)
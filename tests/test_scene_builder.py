@@ -0,0 +1,85 @@
+import os
+import collections
+
+from fspy_maya import fuzz
+from fspy_maya import scene_builder
+
+
+class FailingWorker(scene_builder.DryRunWorker):
+    """Stands in for MayaWorker, failing on shot_005"""
+    def build(self, path, scene_path, **options):
+        if 'shot_005' in path:
+            raise RuntimeError('bad shot')
+        return super().build(path, scene_path, **options)
+
+
+class BrokenWorker(object):
+    """Stands in for a Maya that won't start"""
+    def __init__(self, plate_root=None):
+        raise RuntimeError('no license')
+
+
+def _write_projects(folder, names):
+    paths = []
+    for name in names:
+        path = os.path.join(folder, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as project_file:
+            project_file.write(fuzz.make_project())
+        paths.append(path)
+    return paths
+
+
+def test_workers_are_reused_across_jobs(tmp_path):
+    paths = _write_projects(str(tmp_path / 'in'), ['shot_{0:03d}.fspy'.format(idx) for idx in range(24)])
+    results = list(scene_builder.build_scenes(paths, str(tmp_path / 'out'), workers=3,
+                                              worker_factory=scene_builder.DryRunWorker))
+
+    assert len(results) == len(paths)
+    assert not any(result.error for result in results)
+    assert sorted(result.scene_path for result in results) == sorted(
+        os.path.join(str(tmp_path / 'out'), os.path.splitext(os.path.basename(path))[0] + '.mb') for path in paths)
+
+    jobs_per_worker = collections.Counter(result.worker for result in results)
+    assert len(jobs_per_worker) <= 3
+    #each worker is made once, by its first job
+    started = collections.Counter(result.worker for result in results if result.startup_seconds > 0)
+    assert all(count <= 1 for count in started.values())
+
+
+def test_failures_are_reported_per_shot(tmp_path):
+    paths = _write_projects(str(tmp_path / 'in'), ['shot_{0:03d}.fspy'.format(idx) for idx in range(8)])
+    broken = str(tmp_path / 'in' / 'broken.fspy')
+    with open(broken, 'wb') as project_file:
+        project_file.write(b'not an fspy file')
+
+    results = {result.path: result for result in scene_builder.build_scenes(
+        paths + [broken], str(tmp_path / 'out'), workers=2, worker_factory=FailingWorker)}
+
+    failed = sorted(path for path, result in results.items() if result.error)
+    assert failed == sorted([broken, paths[5]])
+    assert 'bad shot' in results[paths[5]].error
+    assert results[paths[5]].scene_path == ''
+
+
+def test_a_worker_that_wont_start_fails_its_jobs(tmp_path):
+    paths = _write_projects(str(tmp_path / 'in'), ['a.fspy', 'b.fspy'])
+    results = list(scene_builder.build_scenes(paths, str(tmp_path / 'out'), workers=1, worker_factory=BrokenWorker))
+    assert [result.error for result in results] == ['RuntimeError: no license'] * 2
+
+
+def test_scenes_mirror_the_project_folders(tmp_path):
+    input_dir = str(tmp_path / 'in')
+    output_dir = str(tmp_path / 'out')
+    paths = _write_projects(input_dir, [os.path.join('a', 'shot.fspy'), os.path.join('b', 'shot.fspy'),
+                                        os.path.join('b', 'shot 1.fspy'), os.path.join('b', 'shot_1.fspy')])
+
+    results = {result.path: result for result in scene_builder.build_scenes(
+        paths, output_dir, workers=2, worker_factory=scene_builder.DryRunWorker, input_dir=input_dir)}
+
+    assert results[paths[0]].scene_path == os.path.join(output_dir, 'a', 'shot.mb')
+    assert results[paths[1]].scene_path == os.path.join(output_dir, 'b', 'shot.mb')
+    assert results[paths[2]].scene_path == os.path.join(output_dir, 'b', 'shot_1.mb')
+    #sanitized to the same name as the one before it
+    assert results[paths[3]].error and not results[paths[3]].scene_path
@@ -0,0 +1,73 @@
+import os
+import time
+import random
+import threading
+
+from fspy_maya import fuzz
+from fspy_maya.scheduler import MemoryBudgetScheduler
+
+
+def _write_projects(folder, sizes):
+    paths = []
+    for idx, size in enumerate(sizes):
+        path = os.path.join(folder, 'shot_{0}.fspy'.format(idx))
+        with open(path, 'wb') as project_file:
+            project_file.write(fuzz.make_project(image=b'\0' * size))
+        paths.append(path)
+    return paths
+
+
+def test_held_results_count_against_the_budget(tmp_path):
+    rng = random.Random(2)
+    paths = _write_projects(str(tmp_path), [rng.choice([20000, 30000, 50000, 600000, 1200000]) for _ in range(60)])
+    budget = 2 * 1024 * 1024
+
+    lock = threading.Lock()
+    live = [0, 0]
+    def job(path):
+        size = os.path.getsize(path)
+        with lock:
+            live[0] += size
+            live[1] = max(live[1], live[0])
+        time.sleep(0.002)
+        return size
+
+    scheduler = MemoryBudgetScheduler(budget, workers=8)
+    count = 0
+    for result in scheduler.run(paths, job):
+        count += 1
+        #the caller holds the result's bytes until it asks for the next one
+        time.sleep(0.003)
+        with lock:
+            live[0] -= result.result
+
+    assert count == len(paths)
+    assert live[1] <= budget
+    assert scheduler.peak_in_flight_bytes <= budget
+    assert scheduler.in_flight_bytes == 0
+
+
+def test_jobs_start_while_paths_are_read(tmp_path):
+    paths = _write_projects(str(tmp_path), [100] * 4)
+    started = threading.Event()
+    def slow_paths():
+        yield paths[0]
+        #the first job has to start before the rest of the paths show up
+        assert started.wait(5)
+        for path in paths[1:]:
+            yield path
+
+    def job(path):
+        started.set()
+        return path
+
+    results = list(MemoryBudgetScheduler(1024 * 1024, workers=2).run(slow_paths(), job))
+    assert sorted(result.path for result in results) == paths
+
+
+def test_unreadable_headers_fail_without_running(tmp_path):
+    missing = str(tmp_path / 'missing.fspy')
+    results = list(MemoryBudgetScheduler(1024).run([missing], lambda path: path))
+    assert len(results) == 1
+    assert results[0].error is not None
+    assert results[0].cost == 0
@@ -0,0 +1,143 @@
+import math
+import random
+from struct import pack_into
+
+import numpy as np
+import pytest
+
+from fspy_maya import fspy
+from fspy_maya import fuzz
+from fspy_maya import track
+from fspy_maya import conversion
+
+
+def _rotation(rng):
+    x, y, z = [rng.uniform(-1.2, 1.2) for _ in range(3)]
+    rotate_x = np.array([[1, 0, 0], [0, math.cos(x), -math.sin(x)], [0, math.sin(x), math.cos(x)]])
+    rotate_y = np.array([[math.cos(y), 0, math.sin(y)], [0, 1, 0], [-math.sin(y), 0, math.cos(y)]])
+    rotate_z = np.array([[math.cos(z), -math.sin(z), 0], [math.sin(z), math.cos(z), 0], [0, 0, 1]])
+    return rotate_z @ rotate_y @ rotate_x
+
+
+def _write_projects(folder, count, seed=0):
+    rng = random.Random(seed)
+    paths = []
+    for idx in range(count):
+        state = fuzz.make_state()
+        rows = np.eye(4)
+        rows[:3, :3] = _rotation(rng)
+        rows[:3, 3] = [rng.uniform(-10, 10) for _ in range(3)]
+        params = state['cameraParameters']
+        params['cameraTransform']['rows'] = rows.tolist()
+        params['horizontalFieldOfView'] = rng.uniform(0.3, 1.5)
+        params['principalPoint'] = {'x': rng.uniform(-0.2, 0.2), 'y': rng.uniform(-0.2, 0.2)}
+        state['calibrationSettingsBase']['referenceDistanceUnit'] = rng.choice(conversion.REFERENCE_DISTANCE_UNITS)
+        state['globalSettings']['overlay3DGuide'] = rng.choice(['xyGridPlane', 'none'])
+
+        path = folder / 'shot.{0}.fspy'.format(1001 + idx)
+        path.write_bytes(fuzz.make_project(state))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize('maya_up_axis', ['y', 'z'])
+def test_track_values_match_each_project(tmp_path, maya_up_axis):
+    paths = _write_projects(tmp_path, 12)
+    assert track.write_track(str(tmp_path / 'shot.fspt'), paths) == len(paths)
+
+    with track.Track(str(tmp_path / 'shot.fspt')) as camera_track:
+        assert camera_track.frames.tolist() == list(range(1001, 1001 + len(paths)))
+        assert camera_track.plates == [str(tmp_path / path) for path in paths]
+        values = track.get_camera_values(camera_track, maya_up_axis=maya_up_axis)
+
+        for idx, path in enumerate(paths):
+            expected = conversion.get_camera_values(fspy.Project(path), maya_up_axis=maya_up_axis)
+            for field in conversion.CameraValues._fields:
+                actual = getattr(values, field)[idx]
+                if field == 'rotate':
+                    #unwrapped rotations may be a whole turn away
+                    actual = np.angle(np.exp(1j * (np.asarray(actual) - expected.rotate))) + expected.rotate
+                assert np.allclose(actual, getattr(expected, field), atol=1e-9), field
+
+
+def test_a_corrupt_frame_count_is_a_parsing_error(tmp_path):
+    paths = _write_projects(tmp_path, 3)
+    track.write_track(str(tmp_path / 'shot.fspt'), paths)
+    data = bytearray((tmp_path / 'shot.fspt').read_bytes())
+    #the frame count follows the id, version and column count
+    pack_into('<I', data, 8, 1000)
+    (tmp_path / 'bad.fspt').write_bytes(bytes(data))
+
+    with pytest.raises(fspy.ParsingError):
+        track.Track(str(tmp_path / 'bad.fspt'))
+
+
+def test_a_truncated_track_is_a_parsing_error(tmp_path):
+    paths = _write_projects(tmp_path, 3)
+    track.write_track(str(tmp_path / 'shot.fspt'), paths)
+    data = (tmp_path / 'shot.fspt').read_bytes()
+    for size in (10, track.DATA_OFFSET + 100, len(data) - 1):
+        (tmp_path / 'bad.fspt').write_bytes(data[:size])
+        with pytest.raises(fspy.ParsingError):
+            track.Track(str(tmp_path / 'bad.fspt'))
+
+
+def _random_curve(rng, count):
+    times = np.cumsum(rng.uniform(0.5, 2.0, count))
+    kind = rng.integers(3)
+    if kind == 0:
+        values = np.cumsum(rng.normal(0, 1, count))
+    elif kind == 1:
+        values = np.sin(times / rng.uniform(1, 20)) * rng.uniform(0.1, 10)
+    else:
+        #flat stretches with steps and ramps between them
+        values = np.repeat(rng.normal(0, 5, count // 10 + 1), 10)[:count]
+        values[count // 2:] += np.linspace(0, rng.uniform(-5, 5), count - count // 2)
+    return times, values
+
+
+def test_reduced_curves_stay_within_tolerance():
+    rng = np.random.default_rng(0)
+    for case in range(300):
+        count = int(rng.integers(3, 200))
+        tolerance = float(rng.choice([1e-3, 0.01, 0.1, 1.0]))
+        times, values = _random_curve(rng, count)
+        curve = track.reduce_keys(times, values, tolerance)
+
+        assert curve.removed == count - len(curve.times)
+        assert curve.times[0] == times[0]
+        if len(curve.times) > 1:
+            assert curve.times[-1] == times[-1]
+        #the linear curve through the kept keys, checked at every original sample
+        assert np.max(np.abs(np.interp(times, curve.times, curve.values) - values)) <= tolerance + 1e-12, case
+
+
+def test_a_flat_channel_keeps_one_key():
+    times = np.arange(50.0)
+    values = 3.0 + np.random.default_rng(1).uniform(-0.004, 0.004, 50)
+    curve = track.reduce_keys(times, values, 0.01)
+    assert curve.times.tolist() == [0.0]
+    assert curve.removed == 49
+    assert curve.static_segments == [(0.0, 49.0)]
+
+
+def test_a_line_keeps_its_ends():
+    times = np.arange(20.0)
+    curve = track.reduce_keys(times, times * 2.0 + 1.0, 1e-9)
+    assert curve.times.tolist() == [0.0, 19.0]
+    assert curve.removed == 18
+    assert curve.static_segments == []
+
+
+def test_static_segments_are_found():
+    times = np.arange(30.0)
+    values = np.concatenate([np.zeros(10), np.linspace(0, 10, 11)[1:], np.full(10, 10.0)])
+    curve = track.reduce_keys(times, values, 1e-6)
+    assert curve.times.tolist() == [0.0, 9.0, 19.0, 29.0]
+    assert curve.static_segments == [(0.0, 9.0), (19.0, 29.0)]
+
+
+def test_short_curves_are_kept():
+    curve = track.reduce_keys([0.0, 1.0], [5.0, 5.0], 0.1)
+    assert curve.times.tolist() == [0.0, 1.0]
+    assert curve.removed == 0